@@ -10,16 +10,20 @@
 
 
 from typing import Any, TypedDict, Literal, TypeVar
-from enum import EnumType
+from collections.abc import Mapping
+from sys import intern as sys_intern
+from re import compile as re_compile
+from enum import Enum
+from json import JSONEncoder
+from decimal import Decimal
+from functools import lru_cache
+from urllib.parse import urlsplit, parse_qsl, unquote
 from sqlalchemy import Engine, Connection, Transaction, text as sqlalchemy_text, bindparam as sqlalchemy_bindparam
 from sqlalchemy.orm import Session, SessionTransaction
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncConnection, AsyncTransaction, AsyncSession, AsyncSessionTransaction
 from sqlalchemy.engine.url import URL
 from sqlalchemy.sql.elements import TextClause
-from reykit.rbase import Base, throw
-from reykit.rre import search
-from reykit.rdata import to_json
-from reykit.rre import findall
+from reykit.rbase import Base, Null, throw
 
 
 __all__ = (
@@ -39,6 +43,19 @@ SessionT = TypeVar('SessionT', Session, AsyncSession)
 SessionTransactionT = TypeVar('SessionTransactionT', SessionTransaction, AsyncSessionTransaction)
 
 
+_SQL_KEY_RE = re_compile(r'(?:([iI][nN])\s+)?(?<!\\):(\w+)')
+_SQL_SYNTAX_RE = re_compile(r'(?:^|;)[^a-zA-Z;]*([a-zA-Z]+)')
+_JSON_ENCODE = JSONEncoder(
+    ensure_ascii=False,
+    separators=(',', ':'),
+    default=lambda value: (
+        value.__float__()
+        if type(value) == Decimal
+        else repr(value)
+    )
+).encode
+
+
 URLParameters = TypedDict(
     'URLParameters',
     {
@@ -50,7 +67,7 @@ URLParameters = TypedDict(
         'host': str | None,
         'port': str | None,
         'database': str | None,
-        'query': dict[str, str] | None
+        'query': Mapping[str, str] | None
     }
 )
 
@@ -61,6 +78,54 @@ class DatabaseBase(Base):
     """
 
 
+@lru_cache(maxsize=512)
+def _prepare_sql(sql: str) -> tuple[TextClause, tuple[tuple[str, bool], ...]]:
+    """
+    Prepare `TextClause` object and extract keys from SQL, cache by SQL.
+
+    Parameters
+    ----------
+    sql : SQL in method `sqlalchemy.text` format.
+
+    Returns
+    -------
+    TextClause instance, and unique keys with whether it is key of syntax "in".
+    """
+
+    # Extract keys.
+    sql_keys = []
+    sql_keys_in = set()
+    for match in _SQL_KEY_RE.finditer(sql):
+        syntax_in, key = match.groups()
+        key = sys_intern(key)
+        sql_keys.append(key)
+        if syntax_in is not None:
+            sql_keys_in.add(key)
+    sql_keys_in = frozenset(sql_keys_in)
+
+    key_is_in = tuple(
+        (key, key in sql_keys_in)
+        for key in dict.fromkeys(sql_keys)
+    )
+
+    # Handle SQL.
+    if not sql.endswith(';'):
+        sql = sql.rstrip()
+        if not sql.endswith(';'):
+            sql += ';'
+    sql = sqlalchemy_text(sql)
+
+    ## Key of syntax "in".
+    if sql_keys_in:
+        params = [
+            sqlalchemy_bindparam(key, expanding=True)
+            for key in sql_keys_in
+        ]
+        sql = sql.bindparams(*params)
+
+    return sql, key_is_in
+
+
 def handle_sql_data(sql: str | TextClause, data: list[dict]) -> tuple[TextClause, list[dict]]:
     """
     Handle sql and data.
@@ -76,60 +141,109 @@ def handle_sql_data(sql: str | TextClause, data: list[dict]) -> tuple[TextClause
     """
 
     # Parameter.
-    if type(sql) == TextClause:
+    if isinstance(sql, TextClause):
         sql = sql.text
 
-    ## Extract keys.
-    pattern = '(?<!\\\\):(\\w+)'
-    sql_keys = findall(pattern, sql)
-
-    ## Extract keys of syntax "in".
-    pattern = '[iI][nN]\\s+(?<!\\\\):(\\w+)'
-    sql_keys_in = findall(pattern, sql)
-
     # Handle SQL.
-    sql = sql.strip()
-    if sql[-1] != ';':
-        sql += ';'
-    sql = sqlalchemy_text(sql)
-    if len(data) != 0:
-        row = data[0]
-        for key, value in row.items():
-            if key in sql_keys_in:
-                param = sqlalchemy_bindparam(key, expanding=True)
-                sql = sql.bindparams(param)
+    sql, key_is_in = _prepare_sql(sql)
+
+    ## Not data or not key.
+    if (
+        not data
+        or not key_is_in
+    ):
+        return sql, data
 
     # Handle data.
     for row in data:
-        if row == {}:
+        if not row:
             continue
-        for key in sql_keys:
-            value = row.get(key)
+        for key, is_in in key_is_in:
+            value = row.get(key, Null)
 
-            # Empty string.
-            if value == '':
-                value = None
+            # Missing or empty string.
+            if (
+                value is Null
+                or value == ''
+            ):
+                row[key] = None
 
             # JSON.
             elif (
                 isinstance(value, list)
-                and key not in sql_keys_in
+                and not is_in
             ) or isinstance(value, dict):
-                value = to_json(value)
+                row[key] = _JSON_ENCODE(value)
 
             # Array.
             elif isinstance(value, tuple):
-                value = list(value)
+                row[key] = list(value)
 
             # Enum.
-            elif isinstance(type(value), EnumType):
-                value = value.value
-
-            row[key] = value
+            elif isinstance(value, Enum):
+                row[key] = value.value
 
     return sql, data
 
 
+@lru_cache(maxsize=128)
+def _extract_url_str(url: str) -> tuple[
+    str,
+    str | None,
+    str | None,
+    str | None,
+    str | None,
+    int | None,
+    str | None,
+    tuple[tuple[str, str], ...]
+]:
+    """
+    Extract parameters from URL of string, cache by URL.
+
+    Parameters
+    ----------
+    url : URL of string.
+
+    Returns
+    -------
+    URL parameters `backend`, `driver`, `username`, `password`, `host`, `port`, `database` and query items.
+    """
+
+    # Extract.
+    parts = urlsplit(url)
+
+    ## Throw exception.
+    if parts.scheme == '':
+        throw(ValueError, url)
+
+    ## Drivername.
+    backend, _, driver = parts.scheme.partition('+')
+    driver = driver or None
+
+    ## Server.
+    if parts.netloc != '':
+        username = parts.username
+        if username is not None:
+            username = unquote(username)
+        password = parts.password
+        if password is not None:
+            password = unquote(password)
+        host = parts.hostname
+        port = parts.port
+
+    ## SQLite.
+    else:
+        username = password = host = port = None
+
+    ## Database.
+    database = parts.path[1:] or None
+
+    ## Query.
+    query_items = tuple(parse_qsl(parts.query, keep_blank_values=True))
+
+    return backend, driver, username, password, host, port, database, query_items
+
+
 def extract_url(url: str | URL) -> URLParameters:
     """
     Extract parameters from URL of string.
@@ -148,55 +262,31 @@ def extract_url(url: str | URL) -> URLParameters:
 
         ## Type str.
         case str():
-            pattern_remote = r'^([^+]+)\+?([^:]+)??://([^:]+):([^@]+)@([^:]+):(\d+)[/]?([^\?]+)?\??(\S+)?$'
-            pattern_local = r'^([^+]+)\+?([^:]+)??:////?([^\?]+)[\?]?(\S+)?$'
-
-            ### Server.
-            if (result_remote := search(pattern_remote, url)) is not None:
-                (
-                    backend,
-                    driver,
-                    username,
-                    password,
-                    host,
-                    port,
-                    database,
-                    query_str
-                ) = result_remote
-                port = int(port)
-
-            ### SQLite.
-            elif (result_local := search(pattern_local, url)) is not None:
-                username = password = host = port = None
-                (
-                    backend,
-                    driver,
-                    database,
-                    query_str
-                ) = result_local
-
-            ### Throw exception.
-            else:
-                throw(ValueError, url)
-
-            if query_str is not None:
-                query = {
-                    key: value
-                    for query_item_str in query_str.split('&')
-                    for key, value in (query_item_str.split('=', 1),)
-                }
-            else:
-                query = {}
+            (
+                backend,
+                driver,
+                username,
+                password,
+                host,
+                port,
+                database,
+                query_items
+            ) = _extract_url_str(url)
+            query = dict(query_items)
 
         ## Type URL.
         case URL():
-            drivername = url.drivername
+            backend = url.get_backend_name()
+            if '+' in url.drivername:
+                driver = url.get_driver_name()
+            else:
+                driver = None
             username = url.username
             password = url.password
             host = url.host
             port = url.port
             database = url.database
-            query = dict(url.query)
+            query = url.query
 
     ## Drivername.
     if driver is None:
@@ -240,21 +330,23 @@ def extract_engine(engine: Engine | Connection) -> dict[
     """
 
     ## Extract Engine object from Connection boject.
-    if type(engine) == Connection:
+    if isinstance(engine, Connection):
         engine = engine.engine
 
     ## Extract.
-    drivername: str = engine.url.drivername
-    username: str | None = engine.url.username
-    password: str | None = engine.url.password
-    host: str | None = engine.url.host
-    port: str | None = engine.url.port
-    database: str | None = engine.url.database
-    query: dict[str, str] = dict(engine.url.query)
-    pool_size: int = engine.pool._pool.maxsize
-    max_overflow: int = engine.pool._max_overflow
-    pool_timeout: float = engine.pool._timeout
-    pool_recycle: int = engine.pool._recycle
+    url = engine.url
+    pool = engine.pool
+    drivername: str = url.drivername
+    username: str | None = url.username
+    password: str | None = url.password
+    host: str | None = url.host
+    port: str | None = url.port
+    database: str | None = url.database
+    query: Mapping[str, str] = url.query
+    pool_size: int = pool._pool.maxsize
+    max_overflow: int = pool._max_overflow
+    pool_timeout: float = pool._timeout
+    pool_recycle: int = pool._recycle
 
     # Generate parameter.
     params = {
@@ -274,7 +366,30 @@ def extract_engine(engine: Engine | Connection) -> dict[
     return params
 
 
-def get_syntax(self, sql: str | TextClause) -> list[str]:
+@lru_cache(maxsize=256)
+def _get_syntax(sql: str) -> tuple[str, ...]:
+    """
+    Extract SQL syntax type for each segment form SQL, cache by SQL.
+
+    Parameters
+    ----------
+    sql : SQL text.
+
+    Returns
+    -------
+    SQL syntax type for each segment.
+    """
+
+    # Extract.
+    syntax = tuple(
+        syntax_part.upper()
+        for syntax_part in _SQL_SYNTAX_RE.findall(sql)
+    )
+
+    return syntax
+
+
+def get_syntax(sql: str | TextClause) -> list[str]:
     """
     Extract SQL syntax type for each segment form SQL.
 
@@ -288,20 +403,40 @@ def get_syntax(self, sql: str | TextClause) -> list[str]:
     """
 
     # Parameter.
-    if type(sql) == TextClause:
+    if isinstance(sql, TextClause):
         sql = sql.text
 
     # Extract.
-    syntax = [
-        search('[a-zA-Z]+', sql_part).upper()
-        for sql_part in sql.split(';')
-        if sql_part != ''
-    ]
+    syntax = list(_get_syntax(sql))
 
     return syntax
 
 
-def is_multi_sql(self, sql: str | TextClause) -> bool:
+@lru_cache(maxsize=256)
+def _is_multi_sql(sql: str) -> bool:
+    """
+    Judge whether it is multi segment SQL, cache by SQL.
+
+    Parameters
+    ----------
+    sql : SQL text.
+
+    Returns
+    -------
+    Judgment result.
+    """
+
+    # Judge.
+    end = len(sql) - 1
+    while end >= 0 and sql[end].isspace():
+        end -= 1
+    index = sql.find(';')
+    judge = index != -1 and index < end
+
+    return judge
+
+
+def is_multi_sql(sql: str | TextClause) -> bool:
     """
     Judge whether it is multi segment SQL.
 
@@ -315,10 +450,10 @@ def is_multi_sql(self, sql: str | TextClause) -> bool:
     """
 
     # Parameter.
-    if type(sql) == TextClause:
+    if isinstance(sql, TextClause):
         sql = sql.text
 
     # Judge.
-    if ';' in sql.rstrip()[:-1]:
-        return True
-    return False
+    judge = _is_multi_sql(sql)
+
+    return judge
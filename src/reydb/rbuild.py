@@ -9,8 +9,7 @@
 """
 
 
-from typing import TypedDict, NotRequired, Literal, Type, TypeVar, Generic
-from copy import deepcopy
+from typing import TypedDict, NotRequired, Literal, Type, TypeVar, Generic, Final
 from sqlalchemy import UniqueConstraint
 from reykit.rbase import throw, is_instance
 from reykit.rstdout import ask
@@ -34,7 +33,8 @@ FieldSet = TypedDict(
         'type': str,
         'constraint': NotRequired[str | None],
         'comment': NotRequired[str | None],
-        'position': NotRequired[Literal['first'] | str | None]
+        'position': NotRequired[Literal['first'] | str | None],
+        'old_name': NotRequired[str | None]
     }
 )
 type IndexType = Literal['noraml', 'unique', 'fulltext', 'spatial']
@@ -50,6 +50,22 @@ IndexSet = TypedDict(
 DatabaseEngineT = TypeVar('DatabaseEngineT', 'rengine.DatabaseEngine', 'rengine.DatabaseEngineAsync')
 
 
+_INDEX_TYPE_SQL: Final[dict[IndexType, tuple[str, str]]] = {
+    'noraml': ('KEY', ' USING BTREE'),
+    'unique': ('UNIQUE KEY', ' USING BTREE'),
+    'fulltext': ('FULLTEXT KEY', ''),
+    'spatial': ('SPATIAL KEY', '')
+}
+_EXIST_SQL: Final = (
+    'SELECT EXISTS (\n'
+    '    SELECT 1\n'
+    '    FROM "information_schema"."tables"\n'
+    '    WHERE "table_schema" = \'public\' AND "table_name" = :table\n'
+    ')'
+)
+_EXIST_PROBE_MAX: Final = 2
+
+
 class DatabaseBuildSuper(DatabaseBase, Generic[DatabaseEngineT]):
     """
     Database build super type.
@@ -96,26 +112,13 @@ class DatabaseBuildSuper(DatabaseBase, Generic[DatabaseEngineT]):
         return sql
 
 
-    def __get_field_sql(
-        self,
-        name: str,
-        type_: str,
-        constraint: str = 'DEFAULT NULL',
-        comment: str | None = None,
-        position: str | None = None,
-        old_name: str | None = None
-    ) -> str:
+    def __get_field_sql(self, field: FieldSet) -> str:
         """
         Get a field set SQL.
 
         Parameters
         ----------
-        name : Field name.
-        type_ : Field type.
-        constraint : Field constraint.
-        comment : Field comment.
-        position : Field position.
-        old_name : Field old name.
+        field : Field set.
 
         Returns
         -------
@@ -123,53 +126,46 @@ class DatabaseBuildSuper(DatabaseBase, Generic[DatabaseEngineT]):
         """
 
         # Parameter.
+        name = field['name']
+        type_ = field['type']
+        constraint = field.get('constraint') or 'DEFAULT NULL'
+        comment = field.get('comment')
+        position = field.get('position')
+        old_name = field.get('old_name')
 
-        ## Constraint.
-        constraint = ' ' + constraint
+        # Generate.
+        sql_parts = []
+
+        ## Old name.
+        if old_name is not None:
+            sql_parts.append(f'"{old_name}" ')
+
+        ## Name and type and constraint.
+        sql_parts.append(f'"{name}" {type_} {constraint}')
 
         ## Comment.
-        if comment is None:
-            comment = ''
-        else:
-            comment = f" COMMENT '{comment}'"
+        if comment is not None:
+            sql_parts.append(f" COMMENT '{comment}'")
 
         ## Position.
-        match position:
-            case None:
-                position = ''
-            case 'first':
-                position = ' FIRST'
-            case _:
-                position = f' AFTER "{position}"'
+        if position == 'first':
+            sql_parts.append(' FIRST')
+        elif position is not None:
+            sql_parts.append(f' AFTER "{position}"')
 
-        ## Old name.
-        if old_name is None:
-            old_name = ''
-        else:
-            old_name = f'"{old_name}" '
-
-        # Generate.
-        sql = f'{old_name}"{name}" {type_}{constraint}{comment}{position}'
+        ## Join.
+        sql = ''.join(sql_parts)
 
         return sql
 
 
-    def __get_index_sql(
-        self,
-        name: str,
-        fields: str | list[str],
-        type_: IndexType,
-        comment: str | None = None
-    ) -> str:
+    def __get_index_sql(self, index: IndexSet) -> str:
         """
         Get a index set SQL.
 
         Parameters
         ----------
-        name : Index name.
-        fields : Index fileds.
-        type\\_ : Index type.
-        comment : Index comment.
+        index : Index set.
 
         Returns
         -------
@@ -177,29 +173,19 @@ class DatabaseBuildSuper(DatabaseBase, Generic[DatabaseEngineT]):
         """
 
         # Parameter.
-        if fields.__class__ == str:
+        name = index['name']
+        fields = index['fields']
+        type_ = index['type']
+        comment = index.get('comment')
+        if isinstance(fields, str):
             fields = [fields]
-        match type_:
-            case 'noraml':
-                type_ = 'KEY'
-                method = ' USING BTREE'
-            case 'unique':
-                type_ = 'UNIQUE KEY'
-                method = ' USING BTREE'
-            case 'fulltext':
-                type_ = 'FULLTEXT KEY'
-                method = ''
-            case 'spatial':
-                type_ = 'SPATIAL KEY'
-                method = ''
-            case _:
-                throw(ValueError, type_)
-        if comment in (None, ''):
-            comment = ''
-        else:
-            comment = f" COMMENT '{comment}'"
+        type_method = _INDEX_TYPE_SQL.get(type_)
+        if type_method is None:
+            throw(ValueError, type_)
+        type_, method = type_method
 
         # Generate.
+        sql_parts = []
 
         ## Fields.
         sql_fields = ', '.join(
@@ -208,9 +194,39 @@ class DatabaseBuildSuper(DatabaseBase, Generic[DatabaseEngineT]):
                 for field in fields
             ]
         )
+        sql_parts.append(f'{type_} "{name}" ({sql_fields}){method}')
+
+        ## Comment.
+        if comment not in (None, ''):
+            sql_parts.append(f" COMMENT '{comment}'")
 
         ## Join.
-        sql = f'{type_} "{name}" ({sql_fields}){method}{comment}'
+        sql = ''.join(sql_parts)
+
+        return sql
+
+
+    def __get_primary_sql(self, primary: list[str]) -> str:
+        """
+        Get a primary key set SQL.
+
+        Parameters
+        ----------
+        primary : Primary key fields.
+
+        Returns
+        -------
+        Primary key set SQL.
+        """
+
+        # Generate.
+        keys = ', '.join(
+            [
+                f'"{key}"'
+                for key in primary
+            ]
+        )
+        sql = f'PRIMARY KEY ({keys}) USING BTREE'
 
         return sql
 
@@ -225,7 +241,8 @@ class DatabaseBuildSuper(DatabaseBase, Generic[DatabaseEngineT]):
         increment: int = 1,
         charset: str = 'utf8mb4',
         collate: str = 'utf8mb4_0900_ai_ci',
-        comment: str | None = None
+        comment: str | None = None,
+        skip: bool = False
     ) -> str:
         """
         Get SQL of create table.
@@ -267,7 +284,7 @@ class DatabaseBuildSuper(DatabaseBase, Generic[DatabaseEngineT]):
         charset : Charset type.
         collate : Collate type.
         comment : Table comment.
-        execute : Whether directly execute.
+        skip : Whether skip existing table, use syntax `IF NOT EXISTS`.
 
         Returns
         -------
@@ -275,50 +292,37 @@ class DatabaseBuildSuper(DatabaseBase, Generic[DatabaseEngineT]):
         """
 
         # Parameter.
-        if fields.__class__ == dict:
+        if isinstance(fields, dict):
             fields = [fields]
-        if primary.__class__ == str:
+        if isinstance(primary, str):
             primary = [primary]
-        if primary in ([], ['']):
+        if (
+            not primary
+            or primary == ['']
+        ):
             primary = None
-        if indexes.__class__ == dict:
+        if isinstance(indexes, dict):
             indexes = [indexes]
 
-        ## Compatible dictionary key name.
-        fields = deepcopy(fields)
-        for row in fields:
-            row['type_'] = row.pop('type')
-        if indexes is not None:
-            indexes = deepcopy(indexes)
-            for row in indexes:
-                row['type_'] = row.pop('type')
-
         # Generate.
 
         ## Fields.
         sql_fields = [
-            self.__get_field_sql(**field)
+            self.__get_field_sql(field)
             for field in fields
         ]
 
         ## Primary.
         if primary is not None:
-            keys = ', '.join(
-                [
-                    f'"{key}"'
-                    for key in primary
-                ]
-            )
-            sql_primary = f'PRIMARY KEY ({keys}) USING BTREE'
+            sql_primary = self.__get_primary_sql(primary)
             sql_fields.append(sql_primary)
 
         ## Indexes.
         if indexes is not None:
-            sql_indexes = [
-                self.__get_index_sql(**index)
+            sql_fields.extend(
+                self.__get_index_sql(index)
                 for index in indexes
-            ]
-            sql_fields.extend(sql_indexes)
+            )
 
         ## Comment.
         if comment is None:
@@ -326,10 +330,16 @@ class DatabaseBuildSuper(DatabaseBase, Generic[DatabaseEngineT]):
         else:
             sql_comment = f" COMMENT='{comment}'"
 
+        ## Skip.
+        if skip:
+            sql_skip = ' IF NOT EXISTS'
+        else:
+            sql_skip = ''
+
         ## Join.
         sql_fields = ',\n    '.join(sql_fields)
         sql = (
-            f'CREATE TABLE "{table}" (\n'
+            f'CREATE TABLE{sql_skip} "{table}" (\n'
             f'    {sql_fields}\n'
             f') ENGINE={engine} AUTO_INCREMENT={increment} CHARSET={charset} COLLATE={collate}{sql_comment}'
         )
@@ -386,37 +396,29 @@ class DatabaseBuildSuper(DatabaseBase, Generic[DatabaseEngineT]):
         """
 
         # Check.
-        if items == []:
+        if not items:
             throw(ValueError, items)
 
         # Generate select SQL.
-        item_first = items[0]
-        select_first = 'SELECT 0 AS "index",\n \'%s\' AS "item",\n(\n    %s\n)::TEXT AS "value",\n%s AS "comment"' % (
-            item_first['name'],
-            item_first['select'].replace('\n', '\n    '),
-            (
-                'NULL'
-                if 'comment' not in item_first
-                else "'%s'" % item_first['comment']
-            )
-        )
         selects = [
-            "SELECT %s, '%s',\n(\n    %s\n)::TEXT,\n%s" % (
+            (
+                'SELECT %s AS "index",\n     \'%s\' AS "item",\n    (\n        %s\n    )::TEXT AS "value",\n    %s AS "comment"'
+                if index == 0
+                else "SELECT %s, '%s',\n    (\n        %s\n    )::TEXT,\n    %s"
+            ) % (
                 index,
                 item['name'],
-                item['select'].replace('\n', '\n    '),
+                item['select'].replace('\n', '\n        '),
                 (
                     'NULL'
                     if 'comment' not in item
                     else "'%s'" % item['comment']
                 )
             )
-            for index, item in enumerate(items[1:], 1)
+            for index, item in enumerate(items)
         ]
-        selects[0:0] = [select_first]
-        select = '\nUNION\n'.join(selects)
-        select += '\nORDER BY "index"'
-        select = select.replace('\n', '\n    ')
+        select = '\n    UNION\n    '.join(selects)
+        select += '\n    ORDER BY "index"'
         select = f'SELECT "item", "value", "comment"\nFROM (\n    {select}\n) AS "T"'
 
         # Create.
@@ -588,53 +590,39 @@ class DatabaseBuildSuper(DatabaseBase, Generic[DatabaseEngineT]):
         """
 
         # Parameter.
-        if fields.__class__ == dict:
+        if isinstance(fields, dict):
             fields = [fields]
-        if primary.__class__ == str:
+        if isinstance(primary, str):
             primary = [primary]
-        if primary in ([], ['']):
+        if (
+            not primary
+            or primary == ['']
+        ):
             primary = None
-        if indexes.__class__ == dict:
+        if isinstance(indexes, dict):
             indexes = [indexes]
 
-        ## Compatible dictionary key name.
-        fields = deepcopy(fields)
-        for row in fields:
-            row['type_'] = row.pop('type')
-        if indexes is not None:
-            indexes = deepcopy(indexes)
-            for row in indexes:
-                row['type_'] = row.pop('type')
-
         # Generate.
         sql_content = []
 
         ## Fields.
         if fields is not None:
-            sql_fields = [
-                'COLUMN ' + self.__get_field_sql(**field)
+            sql_content.extend(
+                'COLUMN ' + self.__get_field_sql(field)
                 for field in fields
-            ]
-            sql_content.extend(sql_fields)
+            )
 
         ## Primary.
         if primary is not None:
-            keys = ', '.join(
-                [
-                    f'"{key}"'
-                    for key in primary
-                ]
-            )
-            sql_primary = f'PRIMARY KEY ({keys}) USING BTREE'
+            sql_primary = self.__get_primary_sql(primary)
             sql_content.append(sql_primary)
 
         ## Indexes.
         if indexes is not None:
-            sql_indexes = [
-                self.__get_index_sql(**index)
+            sql_content.extend(
+                self.__get_index_sql(index)
                 for index in indexes
-            ]
-            sql_content.extend(sql_indexes)
+            )
 
         ## Join.
         sql_content = ',\n    ADD '.join(sql_content)
@@ -670,9 +658,9 @@ class DatabaseBuildSuper(DatabaseBase, Generic[DatabaseEngineT]):
         """
 
         # Parameter.
-        if fields.__class__ == str:
+        if isinstance(fields, str):
             fields = [fields]
-        if indexes.__class__ == str:
+        if isinstance(indexes, str):
             indexes = [indexes]
 
         # Generate.
@@ -752,14 +740,9 @@ class DatabaseBuildSuper(DatabaseBase, Generic[DatabaseEngineT]):
         """
 
         # Parameter.
-        if fields.__class__ == dict:
+        if isinstance(fields, dict):
             fields = [fields]
 
-        ## Compatible dictionary key name.
-        fields = deepcopy(fields)
-        for row in fields:
-            row['type_'] = row.pop('type')
-
         # Generate.
         sql_content = []
 
@@ -777,7 +760,7 @@ class DatabaseBuildSuper(DatabaseBase, Generic[DatabaseEngineT]):
                         if 'old_name' not in field
                         else 'CHANGE'
                     ),
-                    self.__get_field_sql(**field)
+                    self.__get_field_sql(field)
                 )
                 for field in fields
             ]
@@ -806,7 +789,7 @@ class DatabaseBuildSuper(DatabaseBase, Generic[DatabaseEngineT]):
             sql_collate = f'COLLATE={collate}'
             sql_attr.append(sql_collate)
 
-        if sql_attr != []:
+        if sql_attr:
             sql_attr = ' '.join(sql_attr)
             sql_content.append(sql_attr)
 
@@ -887,25 +870,32 @@ class DatabaseBuildSuper(DatabaseBase, Generic[DatabaseEngineT]):
             text,
             title='SQL',
             frame='top'
-        )
+        ).lower()
 
-        # Check.
-        while True:
-            command = command.lower()
-            match command:
+        # Reenter.
+        text = 'Incorrect input, reenter. (y/n) '
+        while command not in ('y', 'n'):
+            command = input(text).lower()
 
-                ## Confirm.
-                case 'y':
-                    break
+        # Stop.
+        if command == 'n':
+            raise AssertionError('program stop')
 
-                ## Stop.
-                case 'n':
-                    raise AssertionError('program stop')
 
-                ## Reenter.
-                case _:
-                    text = 'Incorrect input, reenter. (y/n) '
-                    command = input(text)
+    def print_build_reports(self, reports: list[str]) -> None:
+        """
+        Print build reports together, and clear them.
+
+        Parameters
+        ----------
+        reports : Build report texts.
+        """
+
+        # Print.
+        if reports:
+            text = '\n'.join(reports)
+            print(text)
+            reports.clear()
 
 
     def get_orm_table_text(self, model: rorm.Model) -> str:
@@ -923,70 +913,61 @@ class DatabaseBuildSuper(DatabaseBase, Generic[DatabaseEngineT]):
 
         # Get.
         table = model._get_table()
-        text = f'TABLE "{table}"'
+        text_table = f'TABLE "{table}"'
         if table.comment:
-            text += f" | COMMENT '{table.comment}'"
+            text_table += f" | COMMENT '{table.comment}'"
+        texts = [text_table]
 
         ## Field.
-        text += '\n' + '\n'.join(
-            [
-                f'    FIELD {column.name} : {column.type}' + (
-                    ' | NOT NULL'
-                    if (
-                        not column.nullable
-                        or column.primary_key
-                    )
-                    else ' | NULL'
-                ) + (
-                    ''
-                    if not column.primary_key
-                    else ' | KEY AUTO'
-                    if column.autoincrement
-                    else ' | KEY'
-                ) + (
-                    f" | DEFAULT {column.server_default.arg}"
-                    if column.server_default
-                    else ''
-                ) + (
-                    f" | COMMMENT '{column.comment}'"
-                    if column.comment
-                    else ''
-                )
-                for column in table.columns
-            ]
-        )
+        for column in table.columns:
+            primary_key = column.primary_key
+            server_default = column.server_default
+            comment = column.comment
+            text_column = [f'    FIELD {column.name} : {column.type}']
+            if (
+                not column.nullable
+                or primary_key
+            ):
+                text_column.append(' | NOT NULL')
+            else:
+                text_column.append(' | NULL')
+            if primary_key:
+                if column.autoincrement:
+                    text_column.append(' | KEY AUTO')
+                else:
+                    text_column.append(' | KEY')
+            if server_default:
+                text_column.append(f' | DEFAULT {server_default.arg}')
+            if comment:
+                text_column.append(f" | COMMMENT '{comment}'")
+            texts.append(''.join(text_column))
 
         ## Index.
-        if table.indexes:
-            text += '\n' + '\n'.join(
+        for index in table.indexes:
+            text_index = '    NORMAL INDEX: ' + ', '.join(
                 [
-                    '    NORMAL INDEX: ' + ', '.join(
-                        [
-                            column.name
-                            for column in index.expressions
-                        ]
-                    )
-                    for index in table.indexes
+                    column.name
+                    for column in index.expressions
                 ]
             )
+            texts.append(text_index)
 
         ## Constraint.
-        if table.constraints:
-            text += '\n' + '\n'.join(
+        for constraint in table.constraints:
+            if isinstance(constraint, UniqueConstraint):
+                text_constraint = '    UNIQUE CONSTRAIN: '
+            else:
+                text_constraint = '    PRIMARY KEY CONSTRAIN: '
+            text_constraint += ', '.join(
                 [
-                    (
-                        '    UNIQUE CONSTRAIN: '
-                        if type(constraint) == UniqueConstraint
-                        else '    PRIMARY KEY CONSTRAIN: '
-                    ) + ', '.join(
-                        [
-                            column.name
-                            for column in constraint.columns
-                        ]
-                    )
-                    for constraint in table.constraints
+                    column.name
+                    for column in constraint.columns
                 ]
             )
+            texts.append(text_constraint)
+
+        ## Join.
+        text = '\n'.join(texts)
 
         return text
 
@@ -1033,6 +1014,32 @@ class DatabaseBuild(DatabaseBuildSuper['rengine.DatabaseEngine']):
         self.engine.orm.drop(*models, skip=skip)
 
 
+    def __exist(self, table: str) -> bool:
+        """
+        Judge table or view whether it exists.
+        When catalog cache not loaded, then only select this name, instead of load all catalog.
+
+        Parameters
+        ----------
+        table : Table or view name.
+
+        Returns
+        -------
+        Judge result.
+        """
+
+        # Cache.
+        if self.engine._catalog is not None:
+            judge = self.engine.catalog.exist(table)
+
+        # Select.
+        else:
+            result = self.engine.execute(_EXIST_SQL, table=table)
+            judge = result.scalar()
+
+        return judge
+
+
     def build(
         self,
         databases: list[dict] | None = None,
@@ -1060,7 +1067,20 @@ class DatabaseBuild(DatabaseBuildSuper['rengine.DatabaseEngine']):
         tables = tables or []
         views = views or []
         views_stats = views_stats or []
+        catalog = self.engine.catalog
+        exist = self.__exist
+        database = self.engine.database
+        catalog_tables: dict[str, list[str]] = {}
         refresh_schema = False
+        reports = []
+
+        ## Load catalog once, when judge existence of many tables or views, instead of select each name.
+        if (
+            skip
+            and self.engine._catalog is None
+            and len(tables) + len(views) + len(views_stats) > _EXIST_PROBE_MAX
+        ):
+            catalog()
 
         # Database.
         for params in databases:
@@ -1077,114 +1097,158 @@ class DatabaseBuild(DatabaseBuildSuper['rengine.DatabaseEngine']):
 
             ## Report.
             text = f"Database '{params['name']}' build completed."
-            print(text)
+            reports.append(text)
+
+            ### Committed, because execute with autocommit.
+            self.print_build_reports(reports)
 
         # Table.
-        for params in tables:
+        with self.engine.connect(ask) as conn:
+            for params in tables:
 
-            ## Parameter.
-            if type(params) == dict:
-                table: str = params['table']
+                ## Parameter.
+                if isinstance(params, dict):
+                    table: str = params['table']
+
+                    ### Exist.
+                    if (
+                        skip
+                        and exist(table)
+                    ):
+                        continue
+
+                    ### SQL.
+                    sql = self.get_sql_create_table(**params, skip=skip)
+
+                    ### Confirm.
+                    if ask:
+                        self.input_confirm_build(sql)
+
+                    ### Execute.
+                    conn.execute(sql)
+                    fields = params['fields']
+                    if isinstance(fields, dict):
+                        fields = [fields]
+                    catalog_tables[table] = [field['name'] for field in fields]
+
+                ## ORM.
+                else:
+                    table = params._get_table().name
+
+                    ## Exist.
+                    if (
+                        skip
+                        and exist(table)
+                    ):
+                        continue
+
+                    ## Confirm.
+                    if ask:
+                        text = self.get_orm_table_text(params)
+                        self.input_confirm_build(text)
+
+                    ## Execute.
+                    conn.commit()
+                    self.create_orm_table(params, skip=skip)
+
+                ## Report.
+                text = f"Table '{table}' of database '{database}' build completed."
+                reports.append(text)
 
-                ### Exist.
+                ### Committed, because execute with autocommit or ORM.
                 if (
-                    skip
-                    and self.engine.catalog.exist(table)
+                    ask
+                    or not isinstance(params, dict)
                 ):
-                    continue
+                    self.print_build_reports(reports)
 
-                ### SQL.
-                sql = self.get_sql_create_table(**params)
+        # Report committed.
+        self.print_build_reports(reports)
 
-                ### Confirm.
-                if ask:
-                    self.input_confirm_build(sql)
+        # Cache catalog.
+        for table, columns in catalog_tables.items():
+            catalog.add(table, columns)
+        catalog_tables.clear()
 
-                ### Execute.
-                self.engine.execute(sql)
+        with self.engine.connect(ask) as conn:
 
-            ## ORM.
-            else:
-                table = params._get_table().name
+            # View.
+            for params in views:
+
+                ## Parameter.
+                table: str = params['table']
 
                 ## Exist.
                 if (
                     skip
-                    and self.engine.catalog.exist(table)
+                    and exist(table)
                 ):
                     continue
 
+                ## SQL.
+                sql = self.get_sql_create_view(**params)
+
                 ## Confirm.
                 if ask:
-                    text = self.get_orm_table_text(params)
-                    self.input_confirm_build(text)
+                    self.input_confirm_build(sql)
 
                 ## Execute.
-                self.create_orm_table(params, skip=skip)
+                conn.execute(sql)
 
-            ## Report.
-            text = f"Table '{table}' of database '{self.engine.database}' build completed."
-            print(text)
-            refresh_schema = True
+                ## Report.
+                text = f"View '{table}' of database '{database}' build completed."
+                reports.append(text)
 
-        # Refresh schema.
-        if refresh_schema:
-            self.engine.catalog()
-            refresh_schema = False
-
-        # View.
-        for params in views:
-
-            ## Exist.
-            if (
-                skip
-                and self.engine.catalog.exist(params['table'])
-            ):
-                continue
+                ### Committed, because execute with autocommit.
+                if ask:
+                    self.print_build_reports(reports)
+                refresh_schema = True
 
-            ## SQL.
-            sql = self.get_sql_create_view(**params)
+            # View stats.
+            for params in views_stats:
 
-            ## Confirm.
-            if ask:
-                self.input_confirm_build(sql)
+                ## Parameter.
+                table: str = params['table']
 
-            ## Execute.
-            self.engine.execute(sql)
+                ## Exist.
+                if (
+                    skip
+                    and exist(table)
+                ):
+                    continue
 
-            ## Report.
-            text = f"View '{params['table']}' of database '{self.engine.database}' build completed."
-            print(text)
-            refresh_schema = True
+                ## SQL.
+                sql = self.get_sql_create_view_stats(**params)
 
-        # View stats.
-        for params in views_stats:
+                ## Confirm.
+                if ask:
+                    self.input_confirm_build(sql)
 
-            ## Exist.
-            if (
-                skip
-                and self.engine.catalog.exist(params['table'])
-            ):
-                continue
+                ## Execute.
+                conn.execute(sql)
+                catalog_tables[table] = ['item', 'value', 'comment']
 
-            ## SQL.
-            sql = self.get_sql_create_view_stats(**params)
+                ## Report.
+                text = f"View '{table}' of database '{database}' build completed."
+                reports.append(text)
 
-            ## Confirm.
-            if ask:
-                self.input_confirm_build(sql)
+                ### Committed, because execute with autocommit.
+                if ask:
+                    self.print_build_reports(reports)
 
-            ## Execute.
-            self.engine.execute(sql)
+        # Report committed.
+        self.print_build_reports(reports)
 
-            ## Report.
-            text = f"View '{params['table']}' of database '{self.engine.database}' build completed."
-            print(text)
-            refresh_schema = True
+        # Cache catalog.
 
-        # Refresh schema.
+        ## View columns unknown.
         if refresh_schema:
-            self.engine.catalog()
+            catalog()
+
+        ## Add.
+        else:
+            for table, columns in catalog_tables.items():
+                catalog.add(table, columns)
 
 
     __call__ = build
@@ -1232,6 +1296,32 @@ class DatabaseBuildAsync(DatabaseBuildSuper['rengine.DatabaseEngineAsync']):
         await self.engine.orm.drop(*models, skip=skip)
 
 
+    async def __exist(self, table: str) -> bool:
+        """
+        Asynchronous judge table or view whether it exists.
+        When catalog cache not loaded, then only select this name, instead of load all catalog.
+
+        Parameters
+        ----------
+        table : Table or view name.
+
+        Returns
+        -------
+        Judge result.
+        """
+
+        # Cache.
+        if self.engine._catalog is not None:
+            judge = await self.engine.catalog.exist(table)
+
+        # Select.
+        else:
+            result = await self.engine.execute(_EXIST_SQL, table=table)
+            judge = result.scalar()
+
+        return judge
+
+
     async def build(
         self,
         databases: list[dict] | None = None,
@@ -1261,7 +1351,20 @@ class DatabaseBuildAsync(DatabaseBuildSuper['rengine.DatabaseEngineAsync']):
         tables_orm = tables_orm or []
         views = views or []
         views_stats = views_stats or []
+        catalog = self.engine.catalog
+        exist = self.__exist
+        database = self.engine.database
+        catalog_tables: dict[str, list[str]] = {}
         refresh_schema = False
+        reports = []
+
+        ## Load catalog once, when judge existence of many tables or views, instead of select each name.
+        if (
+            skip
+            and self.engine._catalog is None
+            and len(tables) + len(views) + len(views_stats) > _EXIST_PROBE_MAX
+        ):
+            await catalog()
 
         # Database.
         for params in databases:
@@ -1278,114 +1381,158 @@ class DatabaseBuildAsync(DatabaseBuildSuper['rengine.DatabaseEngineAsync']):
 
             ## Report.
             text = f"Database '{params['name']}' build completed."
-            print(text)
+            reports.append(text)
+
+            ### Committed, because execute with autocommit.
+            self.print_build_reports(reports)
 
         # Table.
-        for params in tables:
+        async with self.engine.connect(ask) as conn:
+            for params in tables:
 
-            ## Parameter.
-            if type(params) == dict:
-                table: str = params['table']
+                ## Parameter.
+                if isinstance(params, dict):
+                    table: str = params['table']
 
-                ### Exist.
+                    ### Exist.
+                    if (
+                        skip
+                        and await exist(table)
+                    ):
+                        continue
+
+                    ### SQL.
+                    sql = self.get_sql_create_table(**params, skip=skip)
+
+                    ### Confirm.
+                    if ask:
+                        self.input_confirm_build(sql)
+
+                    ### Execute.
+                    await conn.execute(sql)
+                    fields = params['fields']
+                    if isinstance(fields, dict):
+                        fields = [fields]
+                    catalog_tables[table] = [field['name'] for field in fields]
+
+                ## ORM.
+                else:
+                    table = params._get_table().name
+
+                    ## Exist.
+                    if (
+                        skip
+                        and await exist(table)
+                    ):
+                        continue
+
+                    ## Confirm.
+                    if ask:
+                        text = self.get_orm_table_text(params)
+                        self.input_confirm_build(text)
+
+                    ## Execute.
+                    await conn.commit()
+                    await self.create_orm_table(params, skip=skip)
+
+                ## Report.
+                text = f"Table '{table}' of database '{database}' build completed."
+                reports.append(text)
+
+                ### Committed, because execute with autocommit or ORM.
                 if (
-                    skip
-                    and await self.engine.catalog.exist(table)
+                    ask
+                    or not isinstance(params, dict)
                 ):
-                    continue
+                    self.print_build_reports(reports)
 
-                ### SQL.
-                sql = self.get_sql_create_table(**params)
+        # Report committed.
+        self.print_build_reports(reports)
 
-                ### Confirm.
-                if ask:
-                    self.input_confirm_build(sql)
+        # Cache catalog.
+        for table, columns in catalog_tables.items():
+            catalog.add(table, columns)
+        catalog_tables.clear()
 
-                ### Execute.
-                await self.engine.execute(sql)
+        async with self.engine.connect(ask) as conn:
 
-            ## ORM.
-            else:
-                table = params._get_table().name
+            # View.
+            for params in views:
+
+                ## Parameter.
+                table: str = params['table']
 
                 ## Exist.
                 if (
                     skip
-                    and await self.engine.catalog.exist(table)
+                    and await exist(table)
                 ):
                     continue
 
+                ## SQL.
+                sql = self.get_sql_create_view(**params)
+
                 ## Confirm.
                 if ask:
-                    text = self.get_orm_table_text(params)
-                    self.input_confirm_build(text)
+                    self.input_confirm_build(sql)
 
                 ## Execute.
-                await self.create_orm_table(params, skip=skip)
+                await conn.execute(sql)
 
-            ## Report.
-            text = f"Table '{table}' of database '{self.engine.database}' build completed."
-            print(text)
-            refresh_schema = True
+                ## Report.
+                text = f"View '{table}' of database '{database}' build completed."
+                reports.append(text)
 
-        # Refresh schema.
-        if refresh_schema:
-            self.engine.catalog()
-            refresh_schema = False
-
-        # View.
-        for params in views:
-
-            ## Exist.
-            if (
-                skip
-                and await self.engine.catalog.exist(params['table'])
-            ):
-                continue
+                ### Committed, because execute with autocommit.
+                if ask:
+                    self.print_build_reports(reports)
+                refresh_schema = True
 
-            ## SQL.
-            sql = self.get_sql_create_view(**params)
+            # View stats.
+            for params in views_stats:
 
-            ## Confirm.
-            if ask:
-                self.input_confirm_build(sql)
+                ## Parameter.
+                table: str = params['table']
 
-            ## Execute.
-            await self.engine.execute(sql)
+                ## Exist.
+                if (
+                    skip
+                    and await exist(table)
+                ):
+                    continue
 
-            ## Report.
-            text = f"View '{params['table']}' of database '{self.engine.database}' build completed."
-            print(text)
-            refresh_schema = True
+                ## SQL.
+                sql = self.get_sql_create_view_stats(**params)
 
-        # View stats.
-        for params in views_stats:
+                ## Confirm.
+                if ask:
+                    self.input_confirm_build(sql)
 
-            ## Exist.
-            if (
-                skip
-                and await self.engine.catalog.exist(params['table'])
-            ):
-                continue
+                ## Execute.
+                await conn.execute(sql)
+                catalog_tables[table] = ['item', 'value', 'comment']
 
-            ## SQL.
-            sql = self.get_sql_create_view_stats(**params)
+                ## Report.
+                text = f"View '{table}' of database '{database}' build completed."
+                reports.append(text)
 
-            ## Confirm.
-            if ask:
-                self.input_confirm_build(sql)
+                ### Committed, because execute with autocommit.
+                if ask:
+                    self.print_build_reports(reports)
 
-            ## Execute.
-            await self.engine.execute(sql)
+        # Report committed.
+        self.print_build_reports(reports)
 
-            ## Report.
-            text = f"View '{params['table']}' of database '{self.engine.database}' build completed."
-            print(text)
-            refresh_schema = True
+        # Cache catalog.
 
-        # Refresh schema.
+        ## View columns unknown.
         if refresh_schema:
-            self.engine.catalog()
+            await catalog()
+
+        ## Add.
+        else:
+            for table, columns in catalog_tables.items():
+                catalog.add(table, columns)
 
 
     __call__ = build
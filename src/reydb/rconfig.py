@@ -9,13 +9,28 @@
 """
 
 
-from typing import Any, TypedDict, TypeVar, Generic
+from typing import Any, TypedDict, TypeVar, Generic, Final
+from ast import (
+    AST,
+    Call as ASTCall,
+    Attribute as ASTAttribute,
+    Name as ASTName,
+    List as ASTList,
+    Tuple as ASTTuple,
+    Set as ASTSet,
+    Dict as ASTDict,
+    parse as ast_parse,
+    literal_eval
+)
 from datetime import (
     datetime as Datetime,
     date as Date,
     time as Time,
-    timedelta as Timedelta
+    timedelta as Timedelta,
+    timezone as Timezone
 )
+from functools import lru_cache
+from weakref import WeakSet
 from reykit.rbase import Null, throw
 from reykit.rtime import now
 
@@ -39,6 +54,127 @@ ConfigValueT = TypeVar('T', bound=ConfigValue) # Any.
 DatabaseEngineT = TypeVar('DatabaseEngineT', 'rengine.DatabaseEngine', 'rengine.DatabaseEngineAsync')
 
 
+_REMOVE_CHUNK: Final = 1000
+_DATETIME_TYPES: Final = {
+    'datetime': Datetime,
+    'date': Date,
+    'time': Time,
+    'timedelta': Timedelta,
+    'timezone': Timezone
+}
+
+
+def _decode_node(node: AST) -> ConfigValue:
+    """
+    Decode config value from syntax tree node of method `repr` text.
+    Only literal, constructor of `frozenset` and constructor of module `datetime` types are allowed, not execute any other code.
+
+    Parameters
+    ----------
+    node : Syntax tree node.
+
+    Returns
+    -------
+    Config value.
+    """
+
+    # Decode.
+    match node:
+
+        ## Datetime type.
+        case ASTCall(func=ASTAttribute(value=ASTName(id='datetime'), attr=attr)) if attr in _DATETIME_TYPES:
+            type_ = _DATETIME_TYPES[attr]
+            args = [
+                _decode_node(arg)
+                for arg in node.args
+            ]
+            kwargs = {
+                keyword.arg: _decode_node(keyword.value)
+                for keyword in node.keywords
+            }
+            value = type_(*args, **kwargs)
+
+        ## Timezone UTC.
+        case ASTAttribute(value=ASTAttribute(value=ASTName(id='datetime'), attr='timezone'), attr='utc'):
+            value = Timezone.utc
+
+        ## Frozenset.
+        case ASTCall(func=ASTName(id='frozenset'), args=[] | [_], keywords=[]):
+            elts = [
+                _decode_node(arg)
+                for arg in node.args
+            ]
+            value = frozenset(*elts)
+
+        ## Container.
+        case ASTList():
+            value = [
+                _decode_node(elt)
+                for elt in node.elts
+            ]
+        case ASTTuple():
+            value = tuple(
+                _decode_node(elt)
+                for elt in node.elts
+            )
+        case ASTSet():
+            value = {
+                _decode_node(elt)
+                for elt in node.elts
+            }
+        case ASTDict():
+            value = {
+                _decode_node(key): _decode_node(value)
+                for key, value in zip(node.keys, node.values)
+            }
+
+        ## Literal.
+        case _:
+            value = literal_eval(node)
+
+    return value
+
+
+@lru_cache(maxsize=1024)
+def _parse_value(value: str) -> AST:
+    """
+    Parse syntax tree node from method `repr` text, cache by text.
+
+    Parameters
+    ----------
+    value : Method `repr` text.
+
+    Returns
+    -------
+    Syntax tree node.
+    """
+
+    # Parse.
+    node = ast_parse(value, mode='eval').body
+
+    return node
+
+
+def _decode_value(value: str) -> ConfigValue:
+    """
+    Decode config value from method `repr` text.
+
+    Parameters
+    ----------
+    value : Method `repr` text.
+
+    Returns
+    -------
+    Config value.
+    """
+
+    # Decode.
+    node = _parse_value(value)
+    value = _decode_node(node)
+
+    return value
+
+
 class DatabaseORMTableConfig(rorm.Table):
     """
     Database `config` table ORM model.
@@ -60,7 +196,39 @@ class DatabaseConfigSuper(DatabaseBase, Generic[DatabaseEngineT]):
     Can create database used `self.build_db` method.
     """
 
-    _checked: bool = False
+    _checked_engines: Final[WeakSet[DatabaseEngineT]] = WeakSet()
+    _build_tables: Final = [DatabaseORMTableConfig]
+    _build_views_stats: Final = [
+        {
+            'table': 'stats_config',
+            'items': [
+                {
+                    'name': 'count',
+                    'select': (
+                        'SELECT COUNT(1)\n'
+                        'FROM "config"'
+                    ),
+                    'comment': 'Config count.'
+                },
+                {
+                    'name': 'last_create_time',
+                    'select': (
+                        'SELECT MAX("create_time")\n'
+                        'FROM "config"'
+                    ),
+                    'comment': 'Config last record create time.'
+                },
+                {
+                    'name': 'last_update_time',
+                    'select': (
+                        'SELECT MAX("update_time")\n'
+                        'FROM "config"'
+                    ),
+                    'comment': 'Config last record update time.'
+                }
+            ]
+        }
+    ]
 
 
     def __init__(self, engine: DatabaseEngineT) -> None:
@@ -76,12 +244,18 @@ class DatabaseConfigSuper(DatabaseBase, Generic[DatabaseEngineT]):
         self.engine = engine
 
         # Build Database.
-        if not self._checked:
-            if type(self) == DatabaseConfig:
-                self.build_db()
-            elif type(self) == DatabaseConfigAsync:
-                engine.sync_engine.config.build_db()
-            self._checked = True
+        if engine not in self._checked_engines:
+            self._build_db_sync()
+            self._checked_engines.add(engine)
+
+
+    def invalidate(self) -> None:
+        """
+        Clear cache data of all configs of engine, reload when next use cache, used when configs changed by other way.
+        """
+
+        # Clear.
+        self.engine._config_cache = None
 
 
     def handle_build_db(self) -> tuple[list[type[DatabaseORMTableConfig]], list[dict[str, Any]]] :
@@ -94,43 +268,8 @@ class DatabaseConfigSuper(DatabaseBase, Generic[DatabaseEngineT]):
         """
 
         # Parameter.
-        database = self.engine.database
-
-        ## Table.
-        tables = [DatabaseORMTableConfig]
-
-        ## View stats.
-        views_stats = [
-            {
-                'table': 'stats_config',
-                'items': [
-                    {
-                        'name': 'count',
-                        'select': (
-                            'SELECT COUNT(1)\n'
-                            'FROM "config"'
-                        ),
-                        'comment': 'Config count.'
-                    },
-                    {
-                        'name': 'last_create_time',
-                        'select': (
-                            'SELECT MAX("create_time")\n'
-                            'FROM "config"'
-                        ),
-                        'comment': 'Config last record create time.'
-                    },
-                    {
-                        'name': 'last_update_time',
-                        'select': (
-                            'SELECT MAX("update_time")\n'
-                            'FROM "config"'
-                        ),
-                        'comment': 'Config last record update time.'
-                    }
-                ]
-            }
-        ]
+        tables = list(self._build_tables)
+        views_stats = list(self._build_views_stats)
 
         return tables, views_stats
 
@@ -162,6 +301,15 @@ class DatabaseConfig(DatabaseConfigSuper['rengine.DatabaseEngine']):
         self.engine.build.build(tables=tables, views_stats=views_stats, skip=True)
 
 
+    def _build_db_sync(self) -> None:
+        """
+        Check and build database tables, used when initialization.
+        """
+
+        # Build.
+        self.build_db()
+
+
     def data(self) -> ConfigTable:
         """
         Get config data table.
@@ -179,11 +327,10 @@ class DatabaseConfig(DatabaseConfigSuper['rengine.DatabaseEngine']):
         )
 
         # Convert.
-        global_dict = {'datetime': Datetime}
         result = [
             {
                 'key': row['key'],
-                'value': eval(row['value'], global_dict),
+                'value': _decode_value(row['value']),
                 'note': row['note']
             }
             for row in result
@@ -192,7 +339,12 @@ class DatabaseConfig(DatabaseConfigSuper['rengine.DatabaseEngine']):
         return result
 
 
-    def get(self, key: str, default: ConfigValueT | None = None) -> ConfigValue | ConfigValueT:
+    def get(
+        self,
+        key: str,
+        default: ConfigValueT | None = None,
+        cache: bool = False
+    ) -> ConfigValue | ConfigValueT:
         """
         Get config value, when not exist, then return default value.
 
@@ -200,6 +352,7 @@ class DatabaseConfig(DatabaseConfigSuper['rengine.DatabaseEngine']):
         ----------
         key : Config key.
         default : Config default value.
+        cache : Whether use cache data of all configs shared by engine, loaded once by method `self.items`, can reduce database requests.
 
         Returns
         -------
@@ -207,22 +360,29 @@ class DatabaseConfig(DatabaseConfigSuper['rengine.DatabaseEngine']):
         """
 
         # Get.
-        where = '"key" = :key'
-        result = self.engine.execute.select(
-            'config',
-            ('value',),
-            where,
-            limit=1,
-            key=key
-        )
-        value = result.scalar()
 
-        # Default.
-        if value is None:
-            value = default
+        ## Cache.
+        if cache:
+            cache = self.__load()
+            value = cache.get(key, default)
+
+        ## Database.
         else:
-            global_dict = {'datetime': Datetime}
-            value = eval(value, global_dict)
+            where = '"key" = :key'
+            result = self.engine.execute.select(
+                'config',
+                ('value',),
+                where,
+                limit=1,
+                key=key
+            )
+            value = result.scalar()
+
+            ### Default.
+            if value is None:
+                value = default
+            else:
+                value = _decode_value(value)
 
         return value
 
@@ -264,6 +424,11 @@ class DatabaseConfig(DatabaseConfigSuper['rengine.DatabaseEngine']):
         if result.rowcount == 0:
             default = self.get(key)
 
+        # Cache.
+        cache = self.engine._config_cache
+        if cache is not None:
+            cache[key] = default
+
         return default
 
 
@@ -279,12 +444,20 @@ class DatabaseConfig(DatabaseConfigSuper['rengine.DatabaseEngine']):
         """
 
         # Parameter.
-        if type(data) == dict:
+        if isinstance(data, dict):
             data = [data]
-        data = data.copy()
-        for row in data:
-            row['value'] = repr(row['value'])
-            row['type'] = type(row['value']).__name__
+        values = {
+            row['key']: row['value']
+            for row in data
+        }
+        data = [
+            {
+                **row,
+                'type': type(row['value']).__name__,
+                'value': repr(row['value'])
+            }
+            for row in data
+        ]
 
         # Update.
         self.engine.execute.insert(
@@ -295,6 +468,11 @@ class DatabaseConfig(DatabaseConfigSuper['rengine.DatabaseEngine']):
             update_time=':NOW()'
         )
 
+        # Cache.
+        cache = self.engine._config_cache
+        if cache is not None:
+            cache.update(values)
+
 
     def remove(self, key: str | list[str]) -> None:
         """
@@ -306,27 +484,43 @@ class DatabaseConfig(DatabaseConfigSuper['rengine.DatabaseEngine']):
         """
 
         # Remove.
-        if type(key) == str:
-            where = '"key" = :key'
-            limit = 1
+        if isinstance(key, str):
+            result = self.engine.execute.delete(
+                'config',
+                '"key" = :key',
+                limit=1,
+                key=key
+            )
+            rowcount = result.rowcount
+
+        ## Chunk in one transaction.
         else:
-            where = '"key" in :key'
-            limit = None
-        result = self.engine.execute.delete(
-            'config',
-            where,
-            limit=limit,
-            key=key
-        )
+            rowcount = 0
+            with self.engine.connect() as conn:
+                for index in range(0, len(key), _REMOVE_CHUNK):
+                    result = conn.execute.delete(
+                        'config',
+                        '"key" in :key',
+                        key=key[index:index + _REMOVE_CHUNK]
+                    )
+                    rowcount += result.rowcount
 
         # Check.
-        if result.rowcount == 0:
+        if rowcount == 0:
             throw(KeyError, key)
 
+        # Cache.
+        cache = self.engine._config_cache
+        if cache is not None:
+            if isinstance(key, str):
+                key = [key]
+            for key_ in key:
+                cache.pop(key_, None)
+
 
     def items(self) -> dict[str, ConfigValue]:
         """
-        Get all config keys and values.
+        Get all config keys and values, and refresh cache data.
 
         Returns
         -------
@@ -340,62 +534,103 @@ class DatabaseConfig(DatabaseConfigSuper['rengine.DatabaseEngine']):
         )
 
         # Convert.
-        global_dict = {'datetime': Datetime}
         result = result.to_dict('key', 'value')
         result = {
-            key: eval(value, global_dict)
+            key: _decode_value(value)
             for key, value in result.items()
         }
 
+        # Cache.
+        self.engine._config_cache = result.copy()
+
         return result
 
 
-    def keys(self) -> list[str]:
+    def __load(self) -> dict[str, ConfigValue]:
+        """
+        Get cache data of all configs, when not loaded, then load once by method `self.items`.
+        Concurrent threads wait for the same load.
+
+        Returns
+        -------
+        Cache data.
+        """
+
+        # Load.
+        cache = self.engine._config_cache
+        if cache is None:
+            with self.engine._config_lock:
+                if self.engine._config_cache is None:
+                    self.items()
+            cache = self.engine._config_cache
+
+        return cache
+
+
+    def keys(self, cache: bool = False) -> list[str]:
         """
         Get all config keys.
 
+        Parameters
+        ----------
+        cache : Whether use cache data of all configs shared by engine, loaded once by method `self.items`, can reduce database requests.
+
         Returns
         -------
         All config keys.
         """
 
         # Get.
-        result = self.engine.execute.select(
-            'config',
-            ('key',)
-        )
 
-        # Convert.
-        global_dict = {'datetime': Datetime}
-        result = [
-            eval(value, global_dict)
-            for value in result
-        ]
+        ## Cache.
+        if cache:
+            cache = self.__load()
+            result = list(cache)
+
+        ## Database.
+        else:
+            result = self.engine.execute.select(
+                'config',
+                ('key',)
+            )
+            result = [
+                key
+                for key, in result
+            ]
 
         return result
 
 
-    def values(self) -> list[ConfigValue]:
+    def values(self, cache: bool = False) -> list[ConfigValue]:
         """
         Get all config value.
 
+        Parameters
+        ----------
+        cache : Whether use cache data of all configs shared by engine, loaded once by method `self.items`, can reduce database requests.
+
         Returns
         -------
         All config values.
         """
 
         # Get.
-        result = self.engine.execute.select(
-            'config',
-            ('value',)
-        )
 
-        # Convert.
-        global_dict = {'datetime': Datetime}
-        result = [
-            eval(value, global_dict)
-            for value in result
-        ]
+        ## Cache.
+        if cache:
+            cache = self.__load()
+            result = list(cache.values())
+
+        ## Database.
+        else:
+            result = self.engine.execute.select(
+                'config',
+                ('value',)
+            )
+            result = [
+                _decode_value(value)
+                for value, in result
+            ]
 
         return result
 
@@ -438,7 +673,7 @@ class DatabaseConfig(DatabaseConfigSuper['rengine.DatabaseEngine']):
         """
 
         # Parameter.
-        if type(key_and_note) != str:
+        if not isinstance(key_and_note, str):
             key, note = key_and_note
         else:
             key = key_and_note
@@ -447,7 +682,7 @@ class DatabaseConfig(DatabaseConfigSuper['rengine.DatabaseEngine']):
         # Set.
         data = {
             'key': key,
-            'value': repr(value),
+            'value': value,
             'note': note
         }
         self.update(data)
@@ -480,6 +715,24 @@ class DatabaseConfigAsync(DatabaseConfigSuper['rengine.DatabaseEngineAsync']):
         await self.engine.build.build(tables=tables, views_stats=views_stats, skip=True)
 
 
+    def _build_db_sync(self) -> None:
+        """
+        Check and build database tables with temporary synchronous engine, used when initialization.
+        """
+
+        # Parameter.
+        tables, views_stats = self.handle_build_db()
+        temp_engine = self.engine.sync_engine
+
+        # Build.
+        try:
+            temp_engine.build.build(tables=tables, views_stats=views_stats, skip=True)
+
+        # Close.
+        finally:
+            temp_engine.engine.dispose()
+
+
     async def data(self) -> ConfigTable:
         """
         Asynchronous get config data table.
@@ -497,11 +750,10 @@ class DatabaseConfigAsync(DatabaseConfigSuper['rengine.DatabaseEngineAsync']):
         )
 
         # Convert.
-        global_dict = {'datetime': Datetime}
         result = [
             {
                 'key': row['key'],
-                'value': eval(row['value'], global_dict),
+                'value': _decode_value(row['value']),
                 'note': row['note']
             }
             for row in result
@@ -510,7 +762,12 @@ class DatabaseConfigAsync(DatabaseConfigSuper['rengine.DatabaseEngineAsync']):
         return result
 
 
-    async def get(self, key: str, default: ConfigValueT | None = None) -> ConfigValue | ConfigValueT:
+    async def get(
+        self,
+        key: str,
+        default: ConfigValueT | None = None,
+        cache: bool = False
+    ) -> ConfigValue | ConfigValueT:
         """
         Asynchronous get config value, when not exist, then return default value.
 
@@ -518,6 +775,7 @@ class DatabaseConfigAsync(DatabaseConfigSuper['rengine.DatabaseEngineAsync']):
         ----------
         key : Config key.
         default : Config default value.
+        cache : Whether use cache data of all configs shared by engine, loaded once by method `self.items`, can reduce database requests.
 
         Returns
         -------
@@ -525,22 +783,29 @@ class DatabaseConfigAsync(DatabaseConfigSuper['rengine.DatabaseEngineAsync']):
         """
 
         # Get.
-        where = '"key" = :key'
-        result = await self.engine.execute.select(
-            'config',
-            ('value',),
-            where,
-            limit=1,
-            key=key
-        )
-        value = result.scalar()
 
-        # Default.
-        if value is None:
-            value = default
+        ## Cache.
+        if cache:
+            cache = await self.__load()
+            value = cache.get(key, default)
+
+        ## Database.
         else:
-            global_dict = {'datetime': Datetime}
-            value = eval(value, global_dict)
+            where = '"key" = :key'
+            result = await self.engine.execute.select(
+                'config',
+                ('value',),
+                where,
+                limit=1,
+                key=key
+            )
+            value = result.scalar()
+
+            ### Default.
+            if value is None:
+                value = default
+            else:
+                value = _decode_value(value)
 
         return value
 
@@ -582,6 +847,11 @@ class DatabaseConfigAsync(DatabaseConfigSuper['rengine.DatabaseEngineAsync']):
         if result.rowcount == 0:
             default = await self.get(key)
 
+        # Cache.
+        cache = self.engine._config_cache
+        if cache is not None:
+            cache[key] = default
+
         return default
 
 
@@ -597,12 +867,20 @@ class DatabaseConfigAsync(DatabaseConfigSuper['rengine.DatabaseEngineAsync']):
         """
 
         # Parameter.
-        if type(data) == dict:
+        if isinstance(data, dict):
             data = [data]
-        data = data.copy()
-        for row in data:
-            row['value'] = repr(row['value'])
-            row['type'] = type(row['value']).__name__
+        values = {
+            row['key']: row['value']
+            for row in data
+        }
+        data = [
+            {
+                **row,
+                'type': type(row['value']).__name__,
+                'value': repr(row['value'])
+            }
+            for row in data
+        ]
 
         # Update.
         await self.engine.execute.insert(
@@ -613,6 +891,11 @@ class DatabaseConfigAsync(DatabaseConfigSuper['rengine.DatabaseEngineAsync']):
             update_time=':NOW()'
         )
 
+        # Cache.
+        cache = self.engine._config_cache
+        if cache is not None:
+            cache.update(values)
+
 
     async def remove(self, key: str | list[str]) -> None:
         """
@@ -624,27 +907,43 @@ class DatabaseConfigAsync(DatabaseConfigSuper['rengine.DatabaseEngineAsync']):
         """
 
         # Remove.
-        if type(key) == str:
-            where = '"key" = :key'
-            limit = 1
+        if isinstance(key, str):
+            result = await self.engine.execute.delete(
+                'config',
+                '"key" = :key',
+                limit=1,
+                key=key
+            )
+            rowcount = result.rowcount
+
+        ## Chunk in one transaction.
         else:
-            where = '"key" in :key'
-            limit = None
-        result = await self.engine.execute.delete(
-            'config',
-            where,
-            limit=limit,
-            key=key
-        )
+            rowcount = 0
+            async with self.engine.connect() as conn:
+                for index in range(0, len(key), _REMOVE_CHUNK):
+                    result = await conn.execute.delete(
+                        'config',
+                        '"key" in :key',
+                        key=key[index:index + _REMOVE_CHUNK]
+                    )
+                    rowcount += result.rowcount
 
         # Check.
-        if result.rowcount == 0:
+        if rowcount == 0:
             throw(KeyError, key)
 
+        # Cache.
+        cache = self.engine._config_cache
+        if cache is not None:
+            if isinstance(key, str):
+                key = [key]
+            for key_ in key:
+                cache.pop(key_, None)
+
 
     async def items(self) -> dict[str, ConfigValue]:
         """
-        Asynchronous get all config keys and values.
+        Asynchronous get all config keys and values, and refresh cache data.
 
         Returns
         -------
@@ -658,62 +957,103 @@ class DatabaseConfigAsync(DatabaseConfigSuper['rengine.DatabaseEngineAsync']):
         )
 
         # Convert.
-        global_dict = {'datetime': Datetime}
         result = result.to_dict('key', 'value')
         result = {
-            key: eval(value, global_dict)
+            key: _decode_value(value)
             for key, value in result.items()
         }
 
+        # Cache.
+        self.engine._config_cache = result.copy()
+
         return result
 
 
-    async def keys(self) -> list[str]:
+    async def __load(self) -> dict[str, ConfigValue]:
+        """
+        Asynchronous get cache data of all configs, when not loaded, then load once by method `self.items`.
+        Concurrent coroutines wait for the same load.
+
+        Returns
+        -------
+        Cache data.
+        """
+
+        # Load.
+        cache = self.engine._config_cache
+        if cache is None:
+            async with self.engine._config_lock:
+                if self.engine._config_cache is None:
+                    await self.items()
+            cache = self.engine._config_cache
+
+        return cache
+
+
+    async def keys(self, cache: bool = False) -> list[str]:
         """
         Asynchronous get all config keys.
 
+        Parameters
+        ----------
+        cache : Whether use cache data of all configs shared by engine, loaded once by method `self.items`, can reduce database requests.
+
         Returns
         -------
         All config keys.
         """
 
         # Get.
-        result = await self.engine.execute.select(
-            'config',
-            ('key',)
-        )
 
-        # Convert.
-        global_dict = {'datetime': Datetime}
-        result = [
-            eval(value, global_dict)
-            for value in result
-        ]
+        ## Cache.
+        if cache:
+            cache = await self.__load()
+            result = list(cache)
+
+        ## Database.
+        else:
+            result = await self.engine.execute.select(
+                'config',
+                ('key',)
+            )
+            result = [
+                key
+                for key, in result
+            ]
 
         return result
 
 
-    async def values(self) -> list[ConfigValue]:
+    async def values(self, cache: bool = False) -> list[ConfigValue]:
         """
         Asynchronous get all config value.
 
+        Parameters
+        ----------
+        cache : Whether use cache data of all configs shared by engine, loaded once by method `self.items`, can reduce database requests.
+
         Returns
         -------
         All config values.
         """
 
         # Get.
-        result = await self.engine.execute.select(
-            'config',
-            ('value',)
-        )
 
-        # Convert.
-        global_dict = {'datetime': Datetime}
-        result = [
-            eval(value, global_dict)
-            for value in result
-        ]
+        ## Cache.
+        if cache:
+            cache = await self.__load()
+            result = list(cache.values())
+
+        ## Database.
+        else:
+            result = await self.engine.execute.select(
+                'config',
+                ('value',)
+            )
+            result = [
+                _decode_value(value)
+                for value, in result
+            ]
 
         return result
 
@@ -756,7 +1096,7 @@ class DatabaseConfigAsync(DatabaseConfigSuper['rengine.DatabaseEngineAsync']):
         """
 
         # Parameter.
-        if type(key_and_note) != str:
+        if not isinstance(key_and_note, str):
             key, note = key_and_note
         else:
             key = key_and_note
@@ -765,7 +1105,7 @@ class DatabaseConfigAsync(DatabaseConfigSuper['rengine.DatabaseEngineAsync']):
         # Set.
         data = {
             'key': key,
-            'value': repr(value),
+            'value': value,
             'note': note
         }
         await self.update(data)
@@ -51,12 +51,7 @@ class DatabaseConnectionSuper(DatabaseBase, Generic[DatabaseEngineT, DatabaseExe
         # Build.
         self.engine = engine
         self.autocommit = autocommit
-        match self.engine:
-            case rengine.DatabaseEngine():
-                exec = rexec.DatabaseExecute(self)
-            case rengine.DatabaseEngineAsync():
-                exec = rexec.DatabaseExecuteAsync(self)
-        self.execute: DatabaseExecuteT = exec
+        self.execute: DatabaseExecuteT = engine._execute_type(self)
         self.connection: ConnectionT | None = None
         self.transaction: TransactionT | None = None
 
@@ -92,12 +87,23 @@ class DatabaseConnection(DatabaseConnectionSuper['rengine.DatabaseEngine', 'rexe
         exc_type : Exception type.
         """
 
-        # Commit.
-        if exc_type is None:
-            self.commit()
+        # Parameter.
+        transaction = self.transaction
+        conn = self.connection
+        self.transaction = self.connection = None
+
+        # Commit or rollback.
+        try:
+            if transaction is not None:
+                if exc_type is None:
+                    transaction.commit()
+                else:
+                    transaction.rollback()
 
         # Close.
-        self.close()
+        finally:
+            if conn is not None:
+                conn.close()
 
 
     def get_conn(self) -> Connection:
@@ -110,10 +116,11 @@ class DatabaseConnection(DatabaseConnectionSuper['rengine.DatabaseEngine', 'rexe
         """
 
         # Create.
-        if self.connection is None:
-            self.connection = self.engine.engine.connect()
+        conn = self.connection
+        if conn is None:
+            conn = self.connection = self.engine.engine.connect()
 
-        return self.connection
+        return conn
 
 
     def get_begin(self) -> Transaction:
@@ -126,11 +133,12 @@ class DatabaseConnection(DatabaseConnectionSuper['rengine.DatabaseEngine', 'rexe
         """
 
         # Create.
-        if self.transaction is None:
+        transaction = self.transaction
+        if transaction is None:
             conn = self.get_conn()
-            self.transaction = conn.begin()
+            transaction = self.transaction = conn.begin()
 
-        return self.transaction
+        return transaction
 
 
     def commit(self) -> None:
@@ -200,12 +208,23 @@ class DatabaseConnectionAsync(DatabaseConnectionSuper['rengine.DatabaseEngineAsy
         exc_type : Exception type.
         """
 
-        # Commit.
-        if exc_type is None:
-            await self.commit()
+        # Parameter.
+        transaction = self.transaction
+        conn = self.connection
+        self.transaction = self.connection = None
+
+        # Commit or rollback.
+        try:
+            if transaction is not None:
+                if exc_type is None:
+                    await transaction.commit()
+                else:
+                    await transaction.rollback()
 
         # Close.
-        await self.close()
+        finally:
+            if conn is not None:
+                await conn.close()
 
 
     async def get_conn(self) -> AsyncConnection:
@@ -218,10 +237,11 @@ class DatabaseConnectionAsync(DatabaseConnectionSuper['rengine.DatabaseEngineAsy
         """
 
         # Create.
-        if self.connection is None:
-            self.connection = await self.engine.engine.connect()
+        conn = self.connection
+        if conn is None:
+            conn = self.connection = await self.engine.engine.connect()
 
-        return self.connection
+        return conn
 
 
     async def get_begin(self) -> AsyncTransaction:
@@ -234,11 +254,12 @@ class DatabaseConnectionAsync(DatabaseConnectionSuper['rengine.DatabaseEngineAsy
         """
 
         # Create.
-        if self.transaction is None:
+        transaction = self.transaction
+        if transaction is None:
             conn = await self.get_conn()
-            self.transaction = await conn.begin()
+            transaction = self.transaction = await conn.begin()
 
-        return self.transaction
+        return transaction
 
 
     async def commit(self) -> None:
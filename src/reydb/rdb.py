@@ -9,7 +9,7 @@
 """
 
 
-from typing import Any, TypeVar, Generic, overload
+from typing import Any, Literal, TypeVar, Generic, overload
 from collections.abc import Iterable, Sequence
 from reykit.rbase import Null, throw
 from reykit.rtask import ThreadPool, async_gather
@@ -58,6 +58,8 @@ class DatabaseSuper(DatabaseBase, Generic[DatabaseEngineT]):
         pool_timeout: float = 30.0,
         pool_recycle: int | None = 3600,
         echo: bool = False,
+        warm: bool = False,
+        async_driver: Literal['asyncpg', 'psycopg'] = 'asyncpg',
         **query: str
     ) -> DatabaseEngineT: ...
 
@@ -87,6 +89,11 @@ class DatabaseSuper(DatabaseBase, Generic[DatabaseEngineT]):
             - `None | Literal[-1]`: No recycle.
             - `int`: Use this value.
         echo : Whether report SQL execute information, not include ORM execute.
+        warm : Whether pre create `max_keep` connections to warm pool when build instance.
+            Only synchronous engine, asynchronous engine can use `await engine.warm()`.
+        async_driver : Driver of asynchronous engine.
+            - `Literal['asyncpg']`: Use `asyncpg`.
+            - `Literal['psycopg']`: Use asynchronous mode of `psycopg`, same driver as synchronous engine.
         query : Remote server database parameters.
         """
 
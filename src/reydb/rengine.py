@@ -9,12 +9,14 @@
 """
 
 
-from typing import TypeVar, Generic
-from urllib.parse import quote as urllib_quote
+from typing import Literal, TypeVar, Generic, Final
+from urllib.parse import quote as urllib_quote, urlencode
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock as ThreadLock
+from asyncio import Lock as AsyncioLock, gather as asyncio_gather
 from sqlalchemy import Engine, create_engine as sqlalchemy_create_engine
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine as sqlalchemy_create_async_engine
 from reykit.rbase import throw
-from reykit.rtask import ThreadPool, async_gather
 from reykit.rtext import join_data_text
 
 from . import rbase, rbuild, rconfig, rconn, rerror, rexec, rinfo, rorm
@@ -27,6 +29,7 @@ __all__ = (
 )
 
 
+DatabaseEngineT = TypeVar('DatabaseEngineT', 'DatabaseEngine', 'DatabaseEngineAsync')
 DatabaseConnectionT = TypeVar('DatabaseConnectionT', 'rconn.DatabaseConnection', 'rconn.DatabaseConnectionAsync')
 DatabaseExecuteT = TypeVar('DatabaseExecuteT', 'rexec.DatabaseExecute', 'rexec.DatabaseExecuteAsync')
 DatabaseORMT = TypeVar('DatabaseORMT', 'rorm.DatabaseORM', 'rorm.DatabaseORMAsync')
@@ -59,6 +62,9 @@ DatabaseInformationParameterStatusGlobalT = TypeVar(
 )
 
 
+_ASYNC_DRIVERS: Final = ('asyncpg', 'psycopg')
+
+
 class DatabaseEngineSuper(
     rbase.DatabaseBase,
     Generic[
@@ -92,6 +98,8 @@ class DatabaseEngineSuper(
         pool_timeout: float = 30.0,
         pool_recycle: int | None = 3600,
         echo: bool = False,
+        warm: bool = False,
+        async_driver: Literal['asyncpg', 'psycopg'] = 'asyncpg',
         **query: str
     ) -> None:
         """
@@ -111,13 +119,20 @@ class DatabaseEngineSuper(
             - `None | Literal[-1]`: No recycle.
             - `int`: Use this value.
         echo : Whether report SQL execute information, not include ORM execute.
+        warm : Whether pre create `max_keep` connections to warm pool when build instance.
+            Only synchronous engine, asynchronous engine can use `await self.warm()`.
+        async_driver : Driver of asynchronous engine.
+            - `Literal['asyncpg']`: Use `asyncpg`.
+            - `Literal['psycopg']`: Use asynchronous mode of `psycopg`, same driver as synchronous engine.
         query : Remote server database parameters.
         """
 
         # Parameter.
         if max_keep > max_pool:
             throw(ValueError, max_keep, max_pool)
-        if type(port) == str:
+        if async_driver not in _ASYNC_DRIVERS:
+            throw(ValueError, async_driver)
+        if isinstance(port, str):
             port = int(port)
 
         # Build.
@@ -134,14 +149,32 @@ class DatabaseEngineSuper(
         else:
             self.pool_recycle = pool_recycle
         self.echo = echo
+        self.async_driver = async_driver
         self.query = query
 
+        ## URL.
+        self._url = self.__generate_url()
+        url_params = rbase.extract_url(self._url)
+        self._backend: str = url_params['backend']
+        self._driver: str | None = url_params['driver']
+
         ## Schema.
         self._catalog: dict[str, dict[str, list[str]]] | None = None
 
+        ## Config.
+        self._config_cache: dict[str, rconfig.ConfigValue] | None = None
+        self._config_lock = self._config_lock_type()
+
         ## Create engine.
         self.engine = self.__create_engine()
 
+        ## Warm.
+        if (
+            warm
+            and self._warm_init
+        ):
+            self.warm()
+
 
     def __str__(self) -> str:
         """
@@ -177,8 +210,7 @@ class DatabaseEngineSuper(
         """
 
         # Get.
-        url_params = rbase.extract_url(self.url)
-        backend = url_params['backend']
+        backend = self._backend
 
         return backend
 
@@ -194,14 +226,32 @@ class DatabaseEngineSuper(
         """
 
         # Get.
-        url_params = rbase.extract_url(self.url)
-        driver = url_params['driver']
+        driver = self._driver
 
         return driver
 
 
-    @property
-    def url(self) -> str:
+    def __get_drivername(self) -> str:
+        """
+        Get driver name of server URL.
+        Use parameter `async_driver` when it is allowed in `self._drivers`, otherwise the first one as default.
+
+        Returns
+        -------
+        Driver name.
+        """
+
+        # Get.
+        if self.async_driver in self._drivers:
+            driver = self.async_driver
+        else:
+            driver = self._drivers[0]
+        drivername = f'postgresql+{driver}'
+
+        return drivername
+
+
+    def __generate_url(self) -> str:
         """
         Generate server URL.
 
@@ -211,26 +261,35 @@ class DatabaseEngineSuper(
         """
 
         # Generate URL.
-        password = urllib_quote(self.password)
-        match self:
-            case DatabaseEngine():
-                url_ = f'postgresql+psycopg://{self.username}:{password}@{self.host}:{self.port}/{self.database}'
-            case DatabaseEngineAsync():
-                url_ = f'postgresql+asyncpg://{self.username}:{password}@{self.host}:{self.port}/{self.database}'
+        username = urllib_quote(self.username, safe='')
+        password = urllib_quote(self.password, safe='')
+        drivername = self.__get_drivername()
+        url_ = f'{drivername}://{username}:{password}@{self.host}:{self.port}/{self.database}'
 
         # Add Server parameter.
-        if self.query != {}:
-            query = '&'.join(
-                [
-                    f'{key}={value}'
-                    for key, value in self.query.items()
-                ]
-            )
+        if self.query:
+            query = urlencode(self.query, quote_via=urllib_quote)
             url_ = f'{url_}?{query}'
 
         return url_
 
 
+    @property
+    def url(self) -> str:
+        """
+        Server URL.
+
+        Returns
+        -------
+        Server URL.
+        """
+
+        # Get.
+        url_ = self._url
+
+        return url_
+
+
     def __create_engine(self) -> rbase.EngineT:
         """
         Create database `Engine` object.
@@ -251,11 +310,39 @@ class DatabaseEngineSuper(
         }
 
         # Create Engine.
-        match self:
-            case DatabaseEngine():
-                engine = sqlalchemy_create_engine(**engine_params)
-            case DatabaseEngineAsync():
-                engine = sqlalchemy_create_async_engine(**engine_params)
+        engine = self._engine_creator(**engine_params)
+
+        return engine
+
+
+    def _clone(self, engine_type: type[DatabaseEngineT]) -> DatabaseEngineT:
+        """
+        Build new instance of same engine parameters, reuse quoted and parsed server URL.
+
+        Parameters
+        ----------
+        engine_type : Engine type.
+
+        Returns
+        -------
+        Instance.
+        """
+
+        # Build.
+        engine = engine_type.__new__(engine_type)
+        engine.__dict__.update(self.__dict__)
+        engine._catalog = None
+        engine._config_cache = None
+        engine._config_lock = engine._config_lock_type()
+
+        ## URL.
+        drivername = engine.__get_drivername()
+        _, _, url_ = self._url.partition('://')
+        engine._url = f'{drivername}://{url_}'
+        _, _, engine._driver = drivername.partition('+')
+
+        ## Create engine.
+        engine.engine = engine.__create_engine()
 
         return engine
 
@@ -271,8 +358,8 @@ class DatabaseEngineSuper(
         """
 
         # Count.
-        _overflow: int = self.engine.pool._overflow
-        count = self.max_keep + _overflow
+        pool = self.engine.pool
+        count = pool.checkedin() + pool.checkedout()
 
         return count
 
@@ -291,11 +378,7 @@ class DatabaseEngineSuper(
         """
 
         # Build.
-        match self:
-            case DatabaseEngine():
-                conn = rconn.DatabaseConnection(self, autocommit)
-            case DatabaseEngineAsync():
-                conn = rconn.DatabaseConnectionAsync(self, autocommit)
+        conn = self._connection_type(self, autocommit)
 
         return conn
 
@@ -328,11 +411,7 @@ class DatabaseEngineSuper(
         """
 
         # Build.
-        match self:
-            case DatabaseEngine():
-                orm = rorm.DatabaseORM(self)
-            case DatabaseEngineAsync():
-                orm = rorm.DatabaseORMAsync(self)
+        orm = self._orm_type(self)
 
         return orm
 
@@ -348,11 +427,7 @@ class DatabaseEngineSuper(
         """
 
         # Build.
-        match self:
-            case DatabaseEngine():
-                build = rbuild.DatabaseBuild(self)
-            case DatabaseEngineAsync():
-                build = rbuild.DatabaseBuildAsync(self)
+        build = self._build_type(self)
 
         return build
 
@@ -368,11 +443,7 @@ class DatabaseEngineSuper(
         """
 
         # Build.
-        match self:
-            case DatabaseEngine():
-                error = rerror.DatabaseError(self)
-            case DatabaseEngineAsync():
-                error = rerror.DatabaseErrorAsync(self)
+        error = self._error_type(self)
 
         return error
 
@@ -388,11 +459,7 @@ class DatabaseEngineSuper(
         """
 
         # Build.
-        match self:
-            case DatabaseEngine():
-                config = rconfig.DatabaseConfig(self)
-            case DatabaseEngineAsync():
-                config = rconfig.DatabaseConfigAsync(self)
+        config = self._config_type(self)
 
         return config
 
@@ -408,11 +475,7 @@ class DatabaseEngineSuper(
         """
 
         # Build.
-        match self:
-            case DatabaseEngine():
-                schema = rinfo.DatabaseInformationCatalog(self)
-            case DatabaseEngineAsync():
-                schema = rinfo.DatabaseInformationCatalogAsync(self)
+        schema = self._catalog_type(self)
 
         return schema
 
@@ -428,11 +491,7 @@ class DatabaseEngineSuper(
         """
 
         # Build.
-        match self:
-            case DatabaseEngine():
-                param = rinfo.DatabaseInformationParameter(self)
-            case DatabaseEngineAsync():
-                param = rinfo.DatabaseInformationParameterAsync(self)
+        param = self._param_type(self)
 
         return param
 
@@ -456,6 +515,19 @@ class DatabaseEngine(
     Database engine type, based `PostgreSQL`.
     """
 
+    _engine_creator = staticmethod(sqlalchemy_create_engine)
+    _connection_type = rconn.DatabaseConnection
+    _execute_type = rexec.DatabaseExecute
+    _orm_type = rorm.DatabaseORM
+    _build_type = rbuild.DatabaseBuild
+    _error_type = rerror.DatabaseError
+    _config_type = rconfig.DatabaseConfig
+    _config_lock_type = ThreadLock
+    _warm_init = True
+    _drivers: Final = ('psycopg',)
+    _catalog_type = rinfo.DatabaseInformationCatalog
+    _param_type = rinfo.DatabaseInformationParameter
+
 
     @property
     def async_engine(self) -> 'DatabaseEngineAsync':
@@ -464,19 +536,7 @@ class DatabaseEngine(
         """
 
         # Build.
-        db = DatabaseEngineAsync(
-            self.host,
-            self.port,
-            self.username,
-            self.password,
-            self.database,
-            self.max_pool,
-            self.max_keep,
-            self.pool_timeout,
-            self.pool_recycle,
-            self.echo,
-            **self.query
-        )
+        db = self._clone(DatabaseEngineAsync)
 
         return db
 
@@ -494,22 +554,37 @@ class DatabaseEngine(
         # Parameter.
         if num is None:
             num = self.max_keep
-        num = num - self.conn_count
+        conn_count = self.conn_count
+        num = num - conn_count
         if (
             num <= 0
-            or self.conn_count >= self.max_keep
+            or conn_count >= self.max_keep
         ):
             return
 
         # Warm.
 
         ## Create.
-        func = lambda: self.engine.connect().close()
-        pool = ThreadPool(func, _max_workers=num)
-        pool * 5
+        with ThreadPoolExecutor(num) as executor:
+            futures = [
+                executor.submit(self.engine.connect)
+                for _ in range(num)
+            ]
+        excs = [
+            future.exception()
+            for future in futures
+        ]
+
+        ## Close.
+        for future, exc in zip(futures, excs):
+            if exc is None:
+                conn = future.result()
+                conn.close()
 
-        ## Wait.
-        pool.join()
+        ## Throw exception.
+        for exc in excs:
+            if exc is not None:
+                raise exc
 
 
 class DatabaseEngineAsync(
@@ -531,6 +606,19 @@ class DatabaseEngineAsync(
     Asynchronous database engine type, based `PostgreSQL`.
     """
 
+    _engine_creator = staticmethod(sqlalchemy_create_async_engine)
+    _connection_type = rconn.DatabaseConnectionAsync
+    _execute_type = rexec.DatabaseExecuteAsync
+    _orm_type = rorm.DatabaseORMAsync
+    _build_type = rbuild.DatabaseBuildAsync
+    _error_type = rerror.DatabaseErrorAsync
+    _config_type = rconfig.DatabaseConfigAsync
+    _config_lock_type = AsyncioLock
+    _warm_init = False
+    _drivers: Final = _ASYNC_DRIVERS
+    _catalog_type = rinfo.DatabaseInformationCatalogAsync
+    _param_type = rinfo.DatabaseInformationParameterAsync
+
 
     @property
     def sync_engine(self) -> DatabaseEngine:
@@ -539,19 +627,7 @@ class DatabaseEngineAsync(
         """
 
         # Build.
-        db = DatabaseEngine(
-            self.host,
-            self.port,
-            self.username,
-            self.password,
-            self.database,
-            self.max_pool,
-            self.max_keep,
-            self.pool_timeout,
-            self.pool_recycle,
-            self.echo,
-            **self.query
-        )
+        db = self._clone(DatabaseEngine)
 
         return db
 
@@ -569,10 +645,11 @@ class DatabaseEngineAsync(
         # Parameter.
         if num is None:
             num = self.max_keep
-        num = num - self.conn_count
+        conn_count = self.conn_count
+        num = num - conn_count
         if (
             num <= 0
-            or self.conn_count >= self.max_keep
+            or conn_count >= self.max_keep
         ):
             return
 
@@ -583,14 +660,24 @@ class DatabaseEngineAsync(
             self.engine.connect()
             for _ in range(num)
         ]
-        conns = await async_gather(*coroutines)
+        results = await asyncio_gather(*coroutines, return_exceptions=True)
+        conns = [
+            result
+            for result in results
+            if not isinstance(result, BaseException)
+        ]
 
         ## Close.
         coroutines = [
             conn.close()
             for conn in conns
         ]
-        await async_gather(*coroutines)
+        await asyncio_gather(*coroutines)
+
+        ## Throw exception.
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
 
     async def dispose(self) -> None:
@@ -9,12 +9,17 @@
 """
 
 
-from typing import Any, NoReturn, TypeVar, Generic
+from typing import Any, NoReturn, TypeVar, Generic, Final
 from collections.abc import Callable
 from inspect import iscoroutinefunction
-from traceback import StackSummary
+from sys import exception as sys_exception
+from traceback import StackSummary, extract_tb
 from functools import wraps as functools_wraps
-from reykit.rbase import T, Exit, catch_exc
+from threading import Lock, Timer
+from asyncio import Task, create_task, current_task, sleep as asyncio_sleep
+from atexit import register as atexit_register
+from weakref import WeakSet
+from reykit.rbase import T, Exit
 
 from . import rengine
 from . import rorm
@@ -32,6 +37,22 @@ __all__ = (
 DatabaseEngineT = TypeVar('DatabaseEngineT', 'rengine.DatabaseEngine', 'rengine.DatabaseEngineAsync')
 
 
+_BUFFERED_ERRORS: Final[WeakSet['DatabaseError']] = WeakSet()
+
+
+def _flush_buffered_errors() -> None:
+    """
+    Insert remaining buffered records of all alive buffered `DatabaseError` instances, run when exit.
+    """
+
+    # Insert.
+    for error in list(_BUFFERED_ERRORS):
+        error.flush()
+
+
+atexit_register(_flush_buffered_errors)
+
+
 class DatabaseORMTableError(rorm.Table):
     """
     Database "error" table ORM model.
@@ -53,28 +74,96 @@ class DatabaseErrorSuper(DatabaseBase, Generic[DatabaseEngineT]):
     Can create database used "self.build_db" method.
     """
 
-    _checked: bool = False
+    _checked_engines: Final[WeakSet[DatabaseEngineT]] = WeakSet()
+    _build_tables: Final = [DatabaseORMTableError]
+    _build_views_stats: Final = [
+        {
+            'table': 'stats_error',
+            'items': [
+                {
+                    'name': 'count',
+                    'select': (
+                        'SELECT COUNT(1)\n'
+                        'FROM "error"'
+                    ),
+                    'comment': 'Error log count.'
+                },
+                {
+                    'name': 'past_day_count',
+                    'select': (
+                        'SELECT COUNT(1)\n'
+                        'FROM "error"\n'
+                        'WHERE "create_time" > NOW() - INTERVAL \'1 day\''
+                    ),
+                    'comment': 'Error log count in the past day.'
+                },
+                {
+                    'name': 'past_week_count',
+                    'select': (
+                        'SELECT COUNT(1)\n'
+                        'FROM "error"\n'
+                        'WHERE "create_time" > NOW() - INTERVAL \'7 days\''
+                    ),
+                    'comment': 'Error log count in the past week.'
+                },
+                {
+                    'name': 'past_month_count',
+                    'select': (
+                        'SELECT COUNT(1)\n'
+                        'FROM "error"\n'
+                        'WHERE "create_time" > NOW() - INTERVAL \'30 days\''
+                    ),
+                    'comment': 'Error log count in the past month.'
+                },
+                {
+                    'name': 'last_time',
+                    'select': (
+                        'SELECT MAX("create_time")\n'
+                        'FROM "error"'
+                    ),
+                    'comment': 'Error log last record create time.'
+                }
+            ]
+        }
+    ]
 
 
-    def __init__(self, engine: DatabaseEngineT) -> None:
+    def __init__(
+        self,
+        engine: DatabaseEngineT,
+        buffer_max: int = 1,
+        buffer_age: float = 1.0
+    ) -> None:
         """
         Build instance attributes.
 
         Parameters
         ----------
         engine: Database engine.
+        buffer_max : Maximum number of buffered records, when reached, then insert them together.
+            - `Literal[1]`: Not buffer, insert each record immediately.
+        buffer_age : Maximum number of seconds a buffered record waits before insert.
         """
 
         # Build.
         self.engine = engine
+        self.buffer_max = buffer_max
+        self.buffer_age = buffer_age
+        self._buffer: list[dict[str, Any]] = []
+        self._buffer_lock = Lock()
+        self._buffer_timer: Timer | Task | None = None
+
+        ## Insert remaining buffered records when exit.
+        if (
+            buffer_max > 1
+            and isinstance(self, DatabaseError)
+        ):
+            _BUFFERED_ERRORS.add(self)
 
         # Build Database.
-        if not self._checked:
-            if type(self) == DatabaseError:
-                self.build_db()
-            elif type(self) == DatabaseErrorAsync:
-                engine.sync_database.error.build_db()
-            self._checked = True
+        if engine not in self._checked_engines:
+            self._build_db_sync()
+            self._checked_engines.add(engine)
 
 
     def handle_build_db(self) -> tuple[list[type[DatabaseORMTableError]], list[dict[str, Any]]]:
@@ -87,62 +176,8 @@ class DatabaseErrorSuper(DatabaseBase, Generic[DatabaseEngineT]):
         """
 
         # Parameter.
-        database = self.engine.database
-
-        ## Table.
-        tables = [DatabaseORMTableError]
-
-        ## View stats.
-        views_stats = [
-            {
-                'table': 'stats_error',
-                'items': [
-                    {
-                        'name': 'count',
-                        'select': (
-                            'SELECT COUNT(1)\n'
-                            'FROM "error"'
-                        ),
-                        'comment': 'Error log count.'
-                    },
-                    {
-                        'name': 'past_day_count',
-                        'select': (
-                            'SELECT COUNT(1)\n'
-                            'FROM "error"\n'
-                            'WHERE DATE_PART(\'day\', NOW() - "create_time") = 0'
-                        ),
-                        'comment': 'Error log count in the past day.'
-                    },
-                    {
-                        'name': 'past_week_count',
-                        'select': (
-                            'SELECT COUNT(1)\n'
-                            'FROM "error"\n'
-                            'WHERE DATE_PART(\'day\', NOW() - "create_time") <= 6'
-                        ),
-                        'comment': 'Error log count in the past week.'
-                    },
-                    {
-                        'name': 'past_month_count',
-                        'select': (
-                            'SELECT COUNT(1)\n'
-                            'FROM "error"\n'
-                            'WHERE DATE_PART(\'day\', NOW() - "create_time") <= 29'
-                        ),
-                        'comment': 'Error log count in the past month.'
-                    },
-                    {
-                        'name': 'last_time',
-                        'select': (
-                            'SELECT MAX("create_time")\n'
-                            'FROM "error"'
-                        ),
-                        'comment': 'Error log last record create time.'
-                    }
-                ]
-            }
-        ]
+        tables = list(self._build_tables)
+        views_stats = list(self._build_views_stats)
 
         return tables, views_stats
 
@@ -204,6 +239,15 @@ class DatabaseError(DatabaseErrorSuper['rengine.DatabaseEngine']):
         self.engine.build.build(tables=tables, views_stats=views_stats, skip=True)
 
 
+    def _build_db_sync(self) -> None:
+        """
+        Check and build database tables, used when initialization.
+        """
+
+        # Build.
+        self.build_db()
+
+
     def record(
         self,
         exc: BaseException,
@@ -224,15 +268,77 @@ class DatabaseError(DatabaseErrorSuper['rengine.DatabaseEngine']):
         data = self.handle_record(exc, stack, note)
 
         # Insert.
-        self.engine.execute.insert(
-            'error',
-            data=data
-        )
+        if self.buffer_max <= 1:
+            self.engine.execute.insert(
+                'error',
+                data=data
+            )
+            return
+
+        # Buffer.
+        with self._buffer_lock:
+            self._buffer.append(data)
+            full = len(self._buffer) >= self.buffer_max
+            if (
+                not full
+                and self._buffer_timer is None
+            ):
+                self.__start_timer()
+        if full:
+            self.flush()
 
 
     __call__ = record
 
 
+    def __start_timer(self) -> None:
+        """
+        Start timer of insert all buffered exception information after `self.buffer_age` seconds, must hold `self._buffer_lock`.
+        """
+
+        # Start.
+        self._buffer_timer = Timer(self.buffer_age, self.flush)
+        self._buffer_timer.daemon = True
+        self._buffer_timer.start()
+
+
+    def flush(self) -> None:
+        """
+        Insert all buffered exception information into the table of database.
+        When insert fail, then put records back to buffer, start timer to retry, and throw exception.
+        """
+
+        # Parameter.
+        with self._buffer_lock:
+            data = self._buffer
+            self._buffer = []
+            if self._buffer_timer is not None:
+                self._buffer_timer.cancel()
+                self._buffer_timer = None
+
+        # Insert.
+        if data:
+            try:
+                self.engine.execute.insert(
+                    'error',
+                    data=data
+                )
+
+            ## Put back, retry with timer.
+            except Exception:
+                with self._buffer_lock:
+                    self._buffer[:0] = data
+                    if self._buffer_timer is None:
+                        self.__start_timer()
+                raise
+
+            ## Put back, retry with next insert.
+            except BaseException:
+                with self._buffer_lock:
+                    self._buffer[:0] = data
+                raise
+
+
     def record_catch(
         self,
         note: str | None = None,
@@ -248,15 +354,11 @@ class DatabaseError(DatabaseErrorSuper['rengine.DatabaseEngine']):
         """
 
         # Parameter.
-        _, exc, stack = catch_exc()
-
-        # Filter.
-        for type_ in filter_type:
-            if isinstance(exc, type_):
-                break
+        exc = sys_exception()
 
         # Record.
-        else:
+        if not isinstance(exc, filter_type):
+            stack = extract_tb(exc.__traceback__)
             self.record(exc, stack, note)
 
         # Throw exception.
@@ -304,10 +406,6 @@ class DatabaseError(DatabaseErrorSuper['rengine.DatabaseEngine']):
         >>> func(*args, **kwargs)
         """
 
-        # Parameter.
-        if issubclass(filter_type, BaseException):
-            filter_type = (filter_type,)
-
 
         def _wrap(func_: Callable[..., T]) -> Callable[..., T]:
             """
@@ -342,6 +440,10 @@ class DatabaseError(DatabaseErrorSuper['rengine.DatabaseEngine']):
                 try:
                     result = func_(*args, **kwargs)
 
+                # Filter.
+                except filter_type:
+                    raise
+
                 # Record.
                 except BaseException:
                     self.record_catch(note, filter_type)
@@ -381,6 +483,24 @@ class DatabaseErrorAsync(DatabaseErrorSuper['rengine.DatabaseEngineAsync']):
         await self.engine.build.build(tables=tables, views_stats=views_stats, skip=True)
 
 
+    def _build_db_sync(self) -> None:
+        """
+        Check and build database tables with temporary synchronous engine, used when initialization.
+        """
+
+        # Parameter.
+        tables, views_stats = self.handle_build_db()
+        temp_engine = self.engine.sync_engine
+
+        # Build.
+        try:
+            temp_engine.build.build(tables=tables, views_stats=views_stats, skip=True)
+
+        # Close.
+        finally:
+            temp_engine.engine.dispose()
+
+
     async def record(
         self,
         exc: BaseException,
@@ -401,15 +521,108 @@ class DatabaseErrorAsync(DatabaseErrorSuper['rengine.DatabaseEngineAsync']):
         data = self.handle_record(exc, stack, note)
 
         # Insert.
-        await self.engine.execute.insert(
-            'error',
-            data=data
-        )
+        if self.buffer_max <= 1:
+            await self.engine.execute.insert(
+                'error',
+                data=data
+            )
+            return
+
+        # Buffer.
+        self._buffer.append(data)
+        if len(self._buffer) >= self.buffer_max:
+            await self.flush()
+        elif self._buffer_timer is None:
+            self.__start_timer()
 
 
     __call__ = record
 
 
+    def __start_timer(self) -> None:
+        """
+        Start task of insert all buffered exception information after `self.buffer_age` seconds.
+        """
+
+        # Start.
+        self._buffer_timer = create_task(self.__flush_later())
+        self._buffer_timer.add_done_callback(self.__flush_later_done)
+
+
+    def __flush_later_done(self, task: Task) -> None:
+        """
+        Report exception of task of insert after `self.buffer_age` seconds to event loop exception handler.
+
+        Parameters
+        ----------
+        task : Task of insert.
+        """
+
+        # Check.
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is None:
+            return
+
+        # Report.
+        loop = task.get_loop()
+        context = {
+            'message': 'Insert buffered exception information failed, retry later.',
+            'exception': exc,
+            'task': task
+        }
+        loop.call_exception_handler(context)
+
+
+    async def __flush_later(self) -> None:
+        """
+        Asynchronous insert all buffered exception information after `self.buffer_age` seconds.
+        """
+
+        # Wait.
+        await asyncio_sleep(self.buffer_age)
+
+        # Insert.
+        await self.flush()
+
+
+    async def flush(self) -> None:
+        """
+        Asynchronous insert all buffered exception information into the table of database.
+        Remaining buffered records are not inserted when exit, should await this method before shutdown.
+        When insert fail, then put records back to buffer, start task to retry, and throw exception.
+        """
+
+        # Parameter.
+        data = self._buffer
+        self._buffer = []
+        if self._buffer_timer is not None:
+            if self._buffer_timer is not current_task():
+                self._buffer_timer.cancel()
+            self._buffer_timer = None
+
+        # Insert.
+        if data:
+            try:
+                await self.engine.execute.insert(
+                    'error',
+                    data=data
+                )
+
+            ## Put back, retry with task.
+            except Exception:
+                self._buffer[:0] = data
+                if self._buffer_timer is None:
+                    self.__start_timer()
+                raise
+
+            ## Put back, retry with next insert.
+            except BaseException:
+                self._buffer[:0] = data
+                raise
+
+
     async def record_catch(
         self,
         note: str | None = None,
@@ -425,15 +638,11 @@ class DatabaseErrorAsync(DatabaseErrorSuper['rengine.DatabaseEngineAsync']):
         """
 
         # Parameter.
-        _, exc, stack = catch_exc()
-
-        # Filter.
-        for type_ in filter_type:
-            if isinstance(exc, type_):
-                break
+        exc = sys_exception()
 
         # Record.
-        else:
+        if not isinstance(exc, filter_type):
+            stack = extract_tb(exc.__traceback__)
             await self.record(exc, stack, note)
 
         # Throw exception.
@@ -483,10 +692,6 @@ class DatabaseErrorAsync(DatabaseErrorSuper['rengine.DatabaseEngineAsync']):
         >>> await func(*args, **kwargs)
         """
 
-        # Parameter.
-        if issubclass(filter_type, BaseException):
-            filter_type = (filter_type,)
-
 
         def _wrap(func_: Callable[..., T]) -> Callable[..., T]:
             """
@@ -501,6 +706,9 @@ class DatabaseErrorAsync(DatabaseErrorSuper['rengine.DatabaseEngineAsync']):
             Decorated function.
             """
 
+            # Parameter.
+            is_coroutine = iscoroutinefunction(func_)
+
 
             @functools_wraps(func_)
             async def _func(*args, **kwargs) -> Any:
@@ -519,11 +727,15 @@ class DatabaseErrorAsync(DatabaseErrorSuper['rengine.DatabaseEngineAsync']):
 
                 # Try execute.
                 try:
-                    if iscoroutinefunction(func_):
+                    if is_coroutine:
                         result = await func_(*args, **kwargs)
                     else:
                         result = func_(*args, **kwargs)
 
+                # Filter.
+                except filter_type:
+                    raise
+
                 # Record.
                 except BaseException:
                     await self.record_catch(note, filter_type)
@@ -118,6 +118,36 @@ class DatabaseInformationCatalogSuper(DatabaseInformationBase, Generic[DatabaseE
         return judge
 
 
+    def add(self, table: str, columns: list[str]) -> None:
+        """
+        Add table or view to catalog cache, without select database.
+        When catalog cache not loaded, then skip.
+
+        Parameters
+        ----------
+        table : Table or view name.
+        columns : Column names.
+        """
+
+        # Add.
+        if self.engine._catalog is not None:
+            self.engine._catalog[table] = columns
+
+
+    def remove(self, table: str) -> None:
+        """
+        Remove table or view from catalog cache, without select database.
+
+        Parameters
+        ----------
+        table : Table or view name.
+        """
+
+        # Remove.
+        if self.engine._catalog is not None:
+            self.engine._catalog.pop(table, None)
+
+
 class DatabaseInformationCatalog(DatabaseInformationCatalogSuper['rengine.DatabaseEngine']):
     """
     Database information catalog type.
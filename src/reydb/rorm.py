@@ -984,6 +984,11 @@ class DatabaseORMSession(
         # Create.
         metadata.create_all(self.orm.engine.engine, tables, skip)
 
+        # Cache catalog.
+        catalog = self.orm.engine.catalog
+        for table in tables:
+            catalog.add(table.name, list(table.columns.keys()))
+
 
     @wrap_transact
     def drop(
@@ -1013,6 +1018,11 @@ class DatabaseORMSession(
         # Drop.
         metadata.drop_all(self.orm.engine.engine, tables, skip)
 
+        # Cache catalog.
+        catalog = self.orm.engine.catalog
+        for table in tables:
+            catalog.remove(table.name)
+
 
     @wrap_transact
     def get(self, model: type[DatabaseORMModelT] | DatabaseORMModelT, key: Any | tuple[Any]) -> DatabaseORMModelT | None:
@@ -1363,6 +1373,11 @@ class DatabaseORMSessionAsync(
         conn = await self.session.connection()
         await conn.run_sync(metadata.create_all, tables, skip)
 
+        # Cache catalog.
+        catalog = self.orm.engine.catalog
+        for table in tables:
+            catalog.add(table.name, list(table.columns.keys()))
+
 
     @wrap_transact
     async def drop(
@@ -1393,6 +1408,11 @@ class DatabaseORMSessionAsync(
         conn = await self.session.connection()
         await conn.run_sync(metadata.drop_all, tables, skip)
 
+        # Cache catalog.
+        catalog = self.orm.engine.catalog
+        for table in tables:
+            catalog.remove(table.name)
+
 
     @wrap_transact
     async def get(self, model: type[DatabaseORMModelT] | DatabaseORMModelT, key: Any | tuple[Any]) -> DatabaseORMModelT | None:
@@ -0,0 +1,89 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@Time    : 2026-10-15
+@Author  : Rey
+@Contact : reyxbo@163.com
+@Explain : Database config test.
+"""
+
+
+from datetime import datetime, date, time, timedelta, timezone
+from pytest import mark, raises
+
+from reydb.rconfig import _decode_value
+
+
+@mark.parametrize(
+    'value',
+    [
+        True,
+        False,
+        None,
+        'text',
+        '\'quote\' "double" \n',
+        1,
+        -1,
+        1.5,
+        [1, 'a', None],
+        (1, 'a'),
+        (),
+        {'a': 1, 'b': [2, 3]},
+        {1, 2},
+        set(),
+        frozenset({1, 2}),
+        frozenset(),
+        datetime(2025, 1, 2, 3, 4, 5, 6),
+        datetime(2025, 1, 2, 3, 4, tzinfo=timezone.utc),
+        datetime(2025, 1, 2, tzinfo=timezone(timedelta(hours=8))),
+        date(2025, 1, 2),
+        time(3, 4, 5),
+        timedelta(days=1, seconds=2),
+        {'time': [date(2025, 1, 2), (timedelta(),)]}
+    ]
+)
+def test_decode_value_repr(value) -> None:
+    """
+    Test decode config value from method `repr` text.
+    """
+
+    # Decode.
+    text = repr(value)
+    result = _decode_value(text)
+
+    # Check.
+    assert result == value
+    assert type(result) == type(value)
+
+
+@mark.parametrize(
+    'text',
+    [
+        "print(1)",
+        "__import__('os')",
+        "eval('1')",
+        "open('file')",
+        "frozenset(1, 2)",
+        "frozenset(x)",
+        "datetime.datetime.now()",
+        "datetime.datetime(*args)",
+        "datetime.datetime(2025, 1, open('file'))",
+        "x",
+        "os",
+        "datetime",
+        "[1, x]",
+        "os.system",
+        "().__class__",
+        "datetime.datetime.max",
+        "datetime.timezone.utc.__class__"
+    ]
+)
+def test_decode_value_reject(text: str) -> None:
+    """
+    Test reject config value text of call, name and attribute access.
+    """
+
+    # Check.
+    with raises(ValueError):
+        _decode_value(text)
@@ -0,0 +1,32 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@Time    : 2026-10-15
+@Author  : Rey
+@Contact : reyxbo@163.com
+@Explain : Database engine test.
+"""
+
+
+from pytest import mark
+
+from reydb.rengine import DatabaseEngine
+
+
+@mark.parametrize('password', ['a/b', 'a@b', 'a#b', 'a?b', 'a:b', '/@#?:%'])
+def test_url_special_password(password: str) -> None:
+    """
+    Test URL of password with reserved characters.
+    """
+
+    # Build.
+    engine = DatabaseEngine('localhost', 5432, 'user', password, 'db')
+    url = engine.engine.url
+
+    # Check.
+    assert url.password == password
+    assert url.host == 'localhost'
+    assert url.port == 5432
+    assert url.database == 'db'
+    assert engine.async_engine.engine.url.password == password